@@ -0,0 +1,145 @@
+"""Integer fixed-point variants of the resolvers for lockstep-safe simulation.
+
+Probabilities are stored as Q16 integers (``FIXED_ONE`` is 1.0) and checked
+against ``rng.getrandbits(FIXED_BITS)``. Combat and event ratios (0.25, 0.5) are
+powers of two and therefore exact in Q16. Shop multipliers such as 0.9 are not,
+so they are kept as exact integer ratios (``9 / 10``) and applied with
+``value * num // den``. The outcome only depends on integer arithmetic and the
+Mersenne Twister stream, so peers on different platforms stay bit-exact. Luck
+thresholds are cached per luck value because they are recomputed on every roll
+otherwise.
+"""
+from __future__ import annotations
+
+import random
+from typing import Dict, Optional, Tuple
+
+from .entities import Character
+from .resolvers import CombatResolver, EventResolver
+from .shop import ShopManager
+
+FIXED_BITS = 16
+FIXED_ONE = 1 << FIXED_BITS
+
+
+Ratio = Tuple[int, int]
+
+
+def to_fixed(value: float) -> int:
+    """Convert a probability or power-of-two ratio to the nearest Q16 integer."""
+
+    return int(round(value * FIXED_ONE))
+
+
+def to_ratio(value: float, max_denominator: int = 1000) -> Ratio:
+    """Exact integer ratio for a short decimal multiplier, e.g. ``0.9 -> (9, 10)``."""
+
+    for denominator in range(1, max_denominator + 1):
+        numerator = round(value * denominator)
+        if abs(numerator / denominator - value) < 1e-12:
+            return numerator, denominator
+    raise ValueError(f"No ratio with denominator <= {max_denominator} for {value}")
+
+
+def fixed_scale(value: int, ratio: int) -> int:
+    """Multiply an integer by a Q16 ratio, truncating toward zero like ``int()``."""
+
+    product = value * ratio
+    if product < 0:
+        return -((-product) >> FIXED_BITS)
+    return product >> FIXED_BITS
+
+
+def ratio_scale(value: int, ratio: Ratio) -> int:
+    """Multiply an integer by an exact ratio, truncating toward zero like ``int()``."""
+
+    numerator, denominator = ratio
+    product = value * numerator
+    if product < 0:
+        return -((-product) // denominator)
+    return product // denominator
+
+
+def fixed_roll(rng: random.Random, threshold: int) -> bool:
+    """Return ``True`` with probability ``threshold / FIXED_ONE``."""
+
+    return rng.getrandbits(FIXED_BITS) < threshold
+
+
+class FixedPointCombatResolver(CombatResolver):
+    """:class:`CombatResolver` with Q16 hunter bonus and escape thresholds."""
+
+    HUNTER_BONUS_RATIO = to_fixed(CombatResolver.HUNTER_BONUS_RATIO)
+    ESCAPE_BASE_CHANCE = to_fixed(CombatResolver.ESCAPE_BASE_CHANCE)
+    ESCAPE_MAX_CHANCE = to_fixed(CombatResolver.ESCAPE_MAX_CHANCE)
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        super().__init__(rng)
+        self._escape_thresholds: Dict[Tuple[int, int], int] = {}
+
+    def _scale(self, value: int, ratio: int) -> int:  # type: ignore[override]
+        return fixed_scale(value, ratio)
+
+    def _roll(self, chance: int) -> bool:  # type: ignore[override]
+        return fixed_roll(self.rng, chance)
+
+    def escape_chance(self, luck: int, difficulty: int) -> int:  # type: ignore[override]
+        key = (luck, difficulty)
+        threshold = self._escape_thresholds.get(key)
+        if threshold is None:
+            luck_bonus = luck * FIXED_ONE // self.ESCAPE_LUCK_DIVISOR
+            chance = min(self.ESCAPE_MAX_CHANCE, self.ESCAPE_BASE_CHANCE + luck_bonus)
+            threshold = self._escape_thresholds[key] = chance // difficulty
+        return threshold
+
+
+class FixedPointEventResolver(EventResolver):
+    """:class:`EventResolver` with Q16 luck thresholds and rogue bonuses."""
+
+    LUCK_BASE_CHANCE = to_fixed(EventResolver.LUCK_BASE_CHANCE)
+    LUCK_MAX_CHANCE = to_fixed(EventResolver.LUCK_MAX_CHANCE)
+    ROGUE_TRAP_BONUS = to_fixed(EventResolver.ROGUE_TRAP_BONUS)
+    ROGUE_CHEST_BONUS = to_fixed(EventResolver.ROGUE_CHEST_BONUS)
+    TRAP_MITIGATION_RATIO = to_fixed(EventResolver.TRAP_MITIGATION_RATIO)
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        super().__init__(rng)
+        self._luck_thresholds: Dict[int, int] = {}
+
+    def _luck_roll(self, luck: int) -> int:  # type: ignore[override]
+        threshold = self._luck_thresholds.get(luck)
+        if threshold is None:
+            luck_bonus = luck * FIXED_ONE // self.LUCK_DIVISOR
+            chance = min(self.LUCK_MAX_CHANCE, self.LUCK_BASE_CHANCE + luck_bonus)
+            threshold = self._luck_thresholds[luck] = chance
+        return threshold
+
+    def _scale(self, value: int, ratio: int) -> int:  # type: ignore[override]
+        return fixed_scale(value, ratio)
+
+    def _roll(self, chance: int) -> bool:  # type: ignore[override]
+        return fixed_roll(self.rng, chance)
+
+
+class FixedPointShopManager(ShopManager):
+    """:class:`ShopManager` with exact integer-ratio price, resale and exchange multipliers."""
+
+    EXCHANGE_DISCOUNTS = {
+        role: (to_ratio(multiplier), minimum)
+        for role, (multiplier, minimum) in ShopManager.EXCHANGE_DISCOUNTS.items()
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._price_ratios = {role: to_ratio(value) for role, value in self.price_modifiers.items()}
+        self._sell_ratios = {role: to_ratio(self.SELL_RATIO * value) for role, value in self.sell_bonus.items()}
+        self._default_sell_ratio = to_ratio(self.SELL_RATIO)
+
+    def _scale(self, value: int, multiplier: Ratio) -> int:  # type: ignore[override]
+        return ratio_scale(value, multiplier)
+
+    def _price_multiplier(self, buyer: Character) -> Ratio:  # type: ignore[override]
+        return self._price_ratios.get(buyer.role, (1, 1))
+
+    def _sell_multiplier(self, seller: Character) -> Ratio:  # type: ignore[override]
+        return self._sell_ratios.get(seller.role, self._default_sell_ratio)
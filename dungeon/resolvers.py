@@ -32,10 +32,23 @@ class CombatResolver:
     """Resolves combat outcomes including class perks and escape checks."""
 
     HUNTER_BONUS_RATIO = 0.25
+    ESCAPE_BASE_CHANCE = 0.3
+    ESCAPE_MAX_CHANCE = 0.9
+    ESCAPE_LUCK_DIVISOR = 150
 
     def __init__(self, rng: Optional[random.Random] = None) -> None:
         self.rng = rng or random.Random()
 
+    def _scale(self, value: int, ratio: float) -> int:
+        return int(value * ratio)
+
+    def _roll(self, chance: float) -> bool:
+        return self.rng.random() < chance
+
+    def escape_chance(self, luck: int, difficulty: int) -> float:
+        chance = min(self.ESCAPE_MAX_CHANCE, self.ESCAPE_BASE_CHANCE + luck / self.ESCAPE_LUCK_DIVISOR)
+        return chance / difficulty
+
     def calculate_damage(self, attacker: Character, defender: Character) -> int:
         """Compute damage with Mage defense ignore and Hunter bonus damage."""
 
@@ -43,7 +56,7 @@ class CombatResolver:
         base_damage = max(attacker.attack - effective_defense, 1)
 
         if attacker.role is Role.HUNTER:
-            bonus = max(int(base_damage * self.HUNTER_BONUS_RATIO), 1)
+            bonus = max(self._scale(base_damage, self.HUNTER_BONUS_RATIO), 1)
             base_damage += bonus
 
         return base_damage
@@ -52,8 +65,7 @@ class CombatResolver:
         """Luck-driven flee chance that scales with perceived danger."""
 
         difficulty = max(threat_level, 1)
-        escape_chance = min(0.9, 0.3 + actor.luck / 150) / difficulty
-        return self.rng.random() < escape_chance
+        return self._roll(self.escape_chance(actor.luck, difficulty))
 
     def resolve_attack(self, attacker: Character, defender: Character) -> DamageResult:
         """Apply damage and report the defender's resulting HP."""
@@ -77,23 +89,36 @@ class CombatResolver:
 class EventResolver:
     """Handles non-combat events influenced by the adventurer's luck."""
 
+    LUCK_BASE_CHANCE = 0.25
+    LUCK_MAX_CHANCE = 0.95
+    LUCK_DIVISOR = 120
+    ROGUE_TRAP_BONUS = 0.2
+    ROGUE_CHEST_BONUS = 0.15
+    TRAP_MITIGATION_RATIO = 0.5
+
     def __init__(self, rng: Optional[random.Random] = None) -> None:
         self.rng = rng or random.Random()
 
     def _luck_roll(self, luck: int) -> float:
-        return min(0.95, 0.25 + luck / 120)
+        return min(self.LUCK_MAX_CHANCE, self.LUCK_BASE_CHANCE + luck / self.LUCK_DIVISOR)
+
+    def _scale(self, value: int, ratio: float) -> int:
+        return int(value * ratio)
+
+    def _roll(self, chance: float) -> bool:
+        return self.rng.random() < chance
 
     def resolve_trap(self, character: Character) -> EventResult:
         avoid_chance = self._luck_roll(character.luck)
         if character.role is Role.ROGUE:
-            avoid_chance += 0.2
+            avoid_chance += self.ROGUE_TRAP_BONUS
 
-        avoided = self.rng.random() < avoid_chance
+        avoided = self._roll(avoid_chance)
         if avoided:
             return EventResult(event=EventType.TRAP, outcome="avoided", details={"hp": character.hp})
 
         base_damage = 12
-        mitigation = int(character.defense * 0.5)
+        mitigation = self._scale(character.defense, self.TRAP_MITIGATION_RATIO)
         damage = max(base_damage - mitigation, 3)
         character.apply_damage(damage)
         return EventResult(event=EventType.TRAP, outcome="hit", details={"damage": damage, "hp": character.hp})
@@ -101,10 +126,9 @@ class EventResolver:
     def resolve_chest(self, character: Character) -> EventResult:
         rare_threshold = self._luck_roll(character.luck)
         if character.role is Role.ROGUE:
-            rare_threshold += 0.15
+            rare_threshold += self.ROGUE_CHEST_BONUS
 
-        roll = self.rng.random()
-        if roll < rare_threshold:
+        if self._roll(rare_threshold):
             reward = "rare"
             gold = 50
         else:
@@ -120,8 +144,7 @@ class EventResolver:
 
     def resolve_side_quest(self, character: Character) -> EventResult:
         success_chance = self._luck_roll(character.luck)
-        roll = self.rng.random()
-        if roll < success_chance:
+        if self._roll(success_chance):
             heal_amount = 8
             reward_gold = 15
             character.heal(heal_amount)
@@ -19,6 +19,12 @@ class ShopManager:
     """Handles prices, gold flow, and VP exchanges with class perks."""
 
     BASE_EXCHANGE_RATE = 10  # gold -> 1 VP
+    SELL_RATIO = 0.5
+    # Exchange rate discounts per role: (multiplier, minimum rate)
+    EXCHANGE_DISCOUNTS = {
+        Role.MERCHANT: (0.8, 5),
+        Role.CLERIC: (0.9, 6),
+    }
 
     def __init__(self) -> None:
         self.price_modifiers = {
@@ -30,19 +36,22 @@ class ShopManager:
             Role.CLERIC: 1.1,  # community support
         }
 
+    def _scale(self, value: int, multiplier: float) -> int:
+        return int(value * multiplier)
+
     def _price_multiplier(self, buyer: Character) -> float:
         return self.price_modifiers.get(buyer.role, 1.0)
 
     def _sell_multiplier(self, seller: Character) -> float:
-        return self.sell_bonus.get(seller.role, 1.0)
+        return self.SELL_RATIO * self.sell_bonus.get(seller.role, 1.0)
 
     def adjusted_price(self, base_price: int, buyer: Character) -> int:
         multiplier = self._price_multiplier(buyer)
-        return max(int(base_price * multiplier), 1)
+        return max(self._scale(base_price, multiplier), 1)
 
     def adjusted_sell_price(self, base_price: int, seller: Character) -> int:
         multiplier = self._sell_multiplier(seller)
-        return max(int(base_price * 0.5 * multiplier), 1)
+        return max(self._scale(base_price, multiplier), 1)
 
     def buy(self, buyer: Character, base_price: int) -> TransactionResult:
         price = self.adjusted_price(base_price, buyer)
@@ -61,10 +70,9 @@ class ShopManager:
         """Convert gold into VP, with Merchants receiving the best rate."""
 
         rate = self.BASE_EXCHANGE_RATE
-        if character.role is Role.MERCHANT:
-            rate = max(5, int(self.BASE_EXCHANGE_RATE * 0.8))
-        elif character.role is Role.CLERIC:
-            rate = max(6, int(self.BASE_EXCHANGE_RATE * 0.9))
+        if character.role in self.EXCHANGE_DISCOUNTS:
+            multiplier, minimum = self.EXCHANGE_DISCOUNTS[character.role]
+            rate = max(minimum, self._scale(self.BASE_EXCHANGE_RATE, multiplier))
 
         available_gold = character.gold if gold_offered is None else min(character.gold, gold_offered)
         vp_to_grant = available_gold // rate
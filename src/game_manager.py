@@ -5,12 +5,19 @@ from typing import Callable, Dict, Iterable, List, Optional
 from .models import ActionResult, Command, PlayerState
 from .net_session import NetSession
 from .turn_controller import TurnController
+from .turn_window import DEFAULT_TURN_WINDOW
 
 TurnActionResolver = Callable[[Command, int], ActionResult]
 
 
 class GameManager:
-    """Controls 30-turn progression and victory point (VP) scoring."""
+    """Controls turn progression and victory point (VP) scoring.
+
+    Games last ``TURN_LIMIT`` turns unless ``turn_limit`` is given. Commands may be
+    submitted up to ``window_size`` turns ahead; queue memory is bounded by that
+    window rather than by the game length. When a ``net_session`` is passed, its
+    window is used unless ``window_size`` is given, and the two must match.
+    """
 
     TURN_LIMIT = 30
 
@@ -19,10 +26,24 @@ class GameManager:
         player_ids: Iterable[str],
         action_resolver: TurnActionResolver,
         net_session: Optional[NetSession] = None,
+        turn_limit: Optional[int] = None,
+        window_size: Optional[int] = None,
     ) -> None:
-        self.players: Dict[str, PlayerState] = {pid: PlayerState(pid) for pid in player_ids}
-        self.turn_controller = TurnController(player_order=list(player_ids), action_resolver=action_resolver)
-        self.net_session = net_session or NetSession(player_order=list(player_ids))
+        player_order = list(player_ids)
+        self.turn_limit = self.TURN_LIMIT if turn_limit is None else turn_limit
+        if self.turn_limit <= 0:
+            raise ValueError(f"Turn limit must be positive: {self.turn_limit}")
+        if window_size is None:
+            window_size = net_session.window_size if net_session is not None else DEFAULT_TURN_WINDOW
+        elif net_session is not None and net_session.window_size != window_size:
+            raise ValueError(
+                f"Window size {window_size} does not match net session window {net_session.window_size}"
+            )
+        self.players: Dict[str, PlayerState] = {pid: PlayerState(pid) for pid in player_order}
+        self.turn_controller = TurnController(
+            player_order=player_order, action_resolver=action_resolver, window_size=window_size
+        )
+        self.net_session = net_session or NetSession(player_order=player_order, window_size=window_size)
         self.turn_index = 0
 
     def enqueue_commands(self, commands: Iterable[Command]) -> None:
@@ -34,21 +55,28 @@ class GameManager:
             self.turn_controller.queue_input(self.turn_index, command)
             self.net_session.send_command(command)
 
-    def receive_remote_commands(self, commands: Iterable[Command]) -> None:
-        """Inject remote commands received over the network for this turn."""
+    def receive_remote_commands(self, commands: Iterable[Command], turn_index: Optional[int] = None) -> None:
+        """Inject remote commands received over the network.
+
+        Commands target the current turn unless ``turn_index`` names an upcoming
+        turn inside the queue window.
+        """
+
+        target_turn = self.turn_index if turn_index is None else turn_index
+        if target_turn >= self.turn_limit:
+            raise ValueError(f"Turn {target_turn} exceeds turn limit {self.turn_limit}")
 
         for command in commands:
-            self.net_session.receive_command(self.turn_index, command)
-            self.turn_controller.queue_input(self.turn_index, command)
+            self.net_session.receive_command(target_turn, command)
 
     def resolve_current_turn(self) -> List[ActionResult]:
         """Resolve the current turn and apply VP updates."""
 
-        if self.turn_index >= self.TURN_LIMIT:
+        if self.turn_index >= self.turn_limit:
             raise RuntimeError("Turn limit reached")
 
         ordered_commands = self.net_session.collect_turn_commands(self.turn_index)
-        # Ensure the collected commands are queued even if they were already added via receive_remote_commands
+        # Remote commands are only staged in the net session; queue them once they are collected
         for command in ordered_commands:
             self.turn_controller.queue_input(self.turn_index, command)
 
@@ -60,10 +88,10 @@ class GameManager:
         return results
 
     def run_full_game(self, per_turn_commands: Dict[int, Iterable[Command]]) -> List[List[ActionResult]]:
-        """Convenience helper for running a 30-turn loop in offline tests."""
+        """Convenience helper for running the full turn loop in offline tests."""
 
         history: List[List[ActionResult]] = []
-        while self.turn_index < self.TURN_LIMIT:
+        while self.turn_index < self.turn_limit:
             commands = per_turn_commands.get(self.turn_index, [])
             self.enqueue_commands(commands)
             turn_results = self.resolve_current_turn()
@@ -0,0 +1,185 @@
+"""Measure cold import cost of the headless entry points.
+
+Import cost is budgeted in simulated games measured on the same machine, so the
+check tracks the workload rather than the hardware. A cold import (mostly
+``dataclasses``/``enum``/``typing``) costs roughly ten default games, which a
+process per game can never amortise; :func:`measure_startup` therefore also
+checks that a warm worker pool brings the per-game cost well below a cold
+process per game. The interpreter's own startup is reported but not budgeted.
+
+Run ``python -m src.import_budget`` to print the report; the exit status is
+non-zero when the budget is exceeded or a heavy module leaks into startup.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+ENTRY_MODULES = (
+    "dungeon.entities",
+    "dungeon.resolvers",
+    "dungeon.shop",
+    "dungeon_ai.agent",
+    "dungeon_ai.roles",
+    "src.game_manager",
+    "src.simulation",
+)
+
+# Optional pieces that must only be imported on demand (pools, profilers, codecs,
+# sockets, opt-in rules modes).
+HEAVY_MODULES = (
+    "multiprocessing",
+    "concurrent.futures",
+    "cProfile",
+    "pstats",
+    "json",
+    "socket",
+    "asyncio",
+    "numpy",
+    "dungeon.fixed_point",
+)
+
+# Repository import cost allowed, in default simulated games (about 11-16 today).
+IMPORT_BUDGET_GAMES = 20.0
+# Minimum cold-process / warm-pool per-game ratio.
+WARM_POOL_MIN_SPEEDUP = 3.0
+_PACKAGES = ("dungeon", "dungeon_ai", "src")
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Cumulative import times (microseconds) reported by ``-X importtime``.
+
+    ``total_us`` includes interpreter startup modules; ``repo_us`` only counts
+    top-level imports of this repository's packages.
+    """
+
+    total_us: int
+    repo_us: int = 0
+    cumulative_us: Dict[str, int] = field(default_factory=dict)
+    heavy_modules: List[str] = field(default_factory=list)
+
+    def within_budget(self, game_us: float, budget_games: float = IMPORT_BUDGET_GAMES) -> bool:
+        return self.repo_us <= game_us * budget_games and not self.heavy_modules
+
+
+@dataclass(slots=True)
+class StartupReport:
+    """Wall time per game (microseconds) with and without a warm worker pool."""
+
+    cold_game_us: float
+    warm_game_us: float
+
+    @property
+    def speedup(self) -> float:
+        return self.cold_game_us / self.warm_game_us if self.warm_game_us > 0 else 0.0
+
+
+def measure_import_time(modules: Sequence[str] = ENTRY_MODULES) -> ImportReport:
+    """Import ``modules`` in a fresh interpreter and collect ``-X importtime`` output.
+
+    Site packages are skipped (``-S``) so only the interpreter core, the standard
+    library and this repository contribute to the total.
+    """
+
+    statement = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c", statement],
+        cwd=_REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    total = repo = 0
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        # "import time:  self [us] | cumulative |   package.module"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        name = name[1:]
+        cumulative[name.strip()] = int(cumulative_us)
+        if not name.startswith(" "):
+            total += int(cumulative_us)
+            if name.split(".")[0] in _PACKAGES:
+                repo += int(cumulative_us)
+
+    heavy = [module for module in HEAVY_MODULES if module in cumulative]
+    return ImportReport(total_us=total, repo_us=repo, cumulative_us=cumulative, heavy_modules=heavy)
+
+
+def measure_game_time(games: int = 20) -> float:
+    """Average wall time (microseconds) of a default seeded game in this process."""
+
+    from .simulation import SimulationConfig, run_simulation
+
+    run_simulation(SimulationConfig(seed=0))
+    started = time.perf_counter()
+    for seed in range(games):
+        run_simulation(SimulationConfig(seed=seed))
+    return (time.perf_counter() - started) * 1e6 / games
+
+
+def measure_startup(games: int = 8, workers: int = 2) -> StartupReport:
+    """Compare one fresh interpreter per game against one warm pool for the batch.
+
+    The warm figure includes creating and closing the pool, so it only wins when
+    startup is actually amortised across games.
+    """
+
+    from .simulation import SimulationConfig, SimulationRunner
+
+    started = time.perf_counter()
+    for seed in range(games):
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from src.simulation import SimulationConfig, run_simulation; "
+                f"run_simulation(SimulationConfig(seed={seed}))",
+            ],
+            cwd=_REPO_ROOT,
+            check=True,
+        )
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with SimulationRunner(workers=workers) as runner:
+        runner.run_batch(SimulationConfig(seed=seed) for seed in range(games))
+    warm = time.perf_counter() - started
+    return StartupReport(cold_game_us=cold * 1e6 / games, warm_game_us=warm * 1e6 / games)
+
+
+def main() -> int:
+    report = measure_import_time()
+    game_us = measure_game_time()
+    startup = measure_startup()
+    slowest = sorted(
+        ((us, module) for module, us in report.cumulative_us.items() if module.split(".")[0] in _PACKAGES),
+        reverse=True,
+    )
+    print(f"interpreter + repo: {report.total_us} us")
+    print(
+        f"repo imports: {report.repo_us} us = {report.repo_us / game_us:.2f} games "
+        f"(budget {IMPORT_BUDGET_GAMES} games of {game_us:.0f} us)"
+    )
+    for us, module in slowest:
+        print(f"  {us:>8} us  {module}")
+    print(
+        f"per game: {startup.cold_game_us:.0f} us cold process, {startup.warm_game_us:.0f} us warm pool "
+        f"({startup.speedup:.1f}x)"
+    )
+    if report.heavy_modules:
+        print(f"heavy modules imported at startup: {', '.join(report.heavy_modules)}")
+    return 0 if report.within_budget(game_us) and startup.speedup >= WARM_POOL_MIN_SPEEDUP else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
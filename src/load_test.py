@@ -0,0 +1,354 @@
+"""Lockstep load generator with simulated network peers.
+
+Every peer owns a full :class:`GameManager` (and therefore a :class:`NetSession`)
+and plays the same game as the other peers in its match, exactly like real
+lockstep clients. Commands travel through an in-process network on a virtual
+clock that injects latency, jitter, reordering and drops; dropped commands are
+recovered by ack-based retransmission. Many matches run side by side on one
+event loop, so scheduling or transport changes can be measured deterministically.
+
+``python -m src.load_test --games 50 --peers 4 --drop 0.05`` prints the report.
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .game_manager import GameManager
+from .models import ActionResult, Command
+from .turn_window import DEFAULT_TURN_WINDOW
+
+LOAD_ACTION = "roll"
+
+
+@dataclass(slots=True)
+class LoadTestConfig:
+    """Shape of the simulated load.
+
+    Attributes:
+        games: Concurrent matches.
+        peers: Peers (players) per match.
+        turns: Turns per match.
+        latency_ms: Mean one-way delay.
+        jitter_ms: Uniform +/- jitter added to every delivery.
+        reorder_rate: Probability a message is held back by up to ``2 * latency_ms``.
+        drop_rate: Probability a command message is lost (acks are never lost).
+        retransmit_ms: Delay before an unacknowledged command is resent.
+        max_retransmits: Resends of one command before the sender gives up on it;
+            bounds the run so a match that can never finish is reported as stalled.
+        think_ms: Local time a peer spends before submitting its command each turn.
+        window_size: Turn window passed to every ``GameManager``.
+        seed: Seed for network behaviour and commands.
+    """
+
+    games: int = 10
+    peers: int = 4
+    turns: int = GameManager.TURN_LIMIT
+    latency_ms: float = 40.0
+    jitter_ms: float = 10.0
+    reorder_rate: float = 0.0
+    drop_rate: float = 0.0
+    retransmit_ms: float = 200.0
+    max_retransmits: int = 20
+    think_ms: float = 5.0
+    window_size: int = DEFAULT_TURN_WINDOW
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class LoadTestReport:
+    """Aggregate results; latencies are virtual milliseconds from turn start to resolution.
+
+    ``virtual_duration_ms`` ends at the last resolved turn, not at the last idle
+    retransmit timer.
+
+    ``stalled_games`` lists matches where some peer never reached the turn limit;
+    ``desynced_games`` lists finished matches whose peers disagree on standings.
+    """
+
+    turns_completed: int
+    latency_percentiles: Dict[str, float]
+    virtual_duration_ms: float
+    wall_seconds: float
+    messages_sent: int = 0
+    messages_dropped: int = 0
+    retransmits: int = 0
+    abandoned: int = 0
+    rejected: int = 0
+    stalled_games: List[int] = field(default_factory=list)
+    desynced_games: List[int] = field(default_factory=list)
+
+    @property
+    def turns_per_second(self) -> float:
+        """Peer-turns resolved per wall-clock second by the simulator."""
+
+        return self.turns_completed / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def virtual_turns_per_second(self) -> float:
+        """Peer-turns resolved per simulated second of network time."""
+
+        return self.turns_completed * 1000 / self.virtual_duration_ms if self.virtual_duration_ms > 0 else 0.0
+
+    def summary(self) -> str:
+        percentiles = "  ".join(f"{name}={value:.1f}ms" for name, value in self.latency_percentiles.items())
+        return "\n".join(
+            [
+                f"turns completed: {self.turns_completed}",
+                f"turn latency:    {percentiles}",
+                f"throughput:      {self.turns_per_second:.0f} turns/s wall, "
+                f"{self.virtual_turns_per_second:.1f} turns/s virtual",
+                f"messages:        {self.messages_sent} sent, {self.messages_dropped} dropped, "
+                f"{self.retransmits} retransmitted, {self.abandoned} abandoned, {self.rejected} rejected",
+                f"stalled games:   {self.stalled_games or 'none'}",
+                f"desynced games:  {self.desynced_games or 'none'}",
+            ]
+        )
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def _resolve_roll(command: Command, turn_index: int) -> ActionResult:
+    return ActionResult(command.player_id, turn_index, vp_delta=int(command.payload.get("roll", 0)))
+
+
+class _EventLoop:
+    """Virtual-time scheduler shared by every peer and link."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._queue: List[Tuple[float, int, Callable[[], None]]] = []
+        self._sequence = 0
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        heapq.heappush(self._queue, (when, self._sequence, callback))
+        self._sequence += 1
+
+    def run(self) -> None:
+        while self._queue:
+            self.now, _, callback = heapq.heappop(self._queue)
+            callback()
+
+
+class _Peer:
+    def __init__(self, harness: "_LoadHarness", game: int, player_id: str, player_ids: List[str]) -> None:
+        self.harness = harness
+        self.game = game
+        self.player_id = player_id
+        self.remote_ids = [pid for pid in player_ids if pid != player_id]
+        self.manager = GameManager(
+            player_ids,
+            action_resolver=_resolve_roll,
+            turn_limit=harness.config.turns,
+            window_size=harness.config.window_size,
+        )
+        self.submitted_turn = -1
+        self.received: Dict[int, Set[str]] = {}
+        self.unacked: Set[Tuple[str, int]] = set()
+        self.turn_started_at = 0.0
+
+    def start_turn(self) -> None:
+        self.turn_started_at = self.harness.loop.now
+        self.harness.loop.call_at(self.harness.loop.now + self.harness.config.think_ms, self.submit)
+
+    def submit(self) -> None:
+        turn = self.manager.turn_index
+        roll = self.harness.rng.randint(0, 3)
+        self.manager.enqueue_commands([Command(self.player_id, LOAD_ACTION, {"roll": roll})])
+        self.submitted_turn = turn
+        for command in self.manager.net_session.pop_outgoing():
+            for remote_id in self.remote_ids:
+                self.unacked.add((remote_id, turn))
+                self.harness.transmit(self, remote_id, turn, command)
+        self.try_advance()
+
+    def deliver(self, sender: "_Peer", turn: int, command: Command) -> None:
+        """Accept a command and ack it; rejected commands stay unacked and are resent."""
+
+        seen = self.received.get(turn, ())
+        if turn < self.manager.turn_index or command.player_id in seen:
+            # Late or duplicate retransmission: the command is already applied.
+            self.harness.acknowledge(self, sender, turn)
+            return
+
+        try:
+            self.manager.receive_remote_commands([command], turn_index=turn)
+        except ValueError:
+            self.harness.report_rejected()
+            return
+        self.received.setdefault(turn, set()).add(command.player_id)
+        self.harness.acknowledge(self, sender, turn)
+        self.try_advance()
+
+    def try_advance(self) -> None:
+        """Resolve the current turn once the local and every remote command are in."""
+
+        turn = self.manager.turn_index
+        if turn >= self.manager.turn_limit or self.submitted_turn != turn:
+            return
+        if len(self.received.get(turn, ())) < len(self.remote_ids):
+            return
+
+        self.manager.resolve_current_turn()
+        self.received.pop(turn, None)
+        self.harness.record_turn(self.harness.loop.now - self.turn_started_at)
+        if self.manager.turn_index < self.manager.turn_limit:
+            self.start_turn()
+
+
+class _LoadHarness:
+    def __init__(self, config: LoadTestConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.network_rng = random.Random(config.seed + 1)
+        self.loop = _EventLoop()
+        self.latencies: List[float] = []
+        self.last_turn_at = 0.0
+        self.messages_sent = 0
+        self.messages_dropped = 0
+        self.retransmits = 0
+        self.abandoned = 0
+        self.rejected = 0
+        self.peers: Dict[int, Dict[str, _Peer]] = {}
+
+        player_ids = [f"p{index + 1}" for index in range(config.peers)]
+        for game in range(config.games):
+            self.peers[game] = {pid: _Peer(self, game, pid, player_ids) for pid in player_ids}
+
+    def _delay(self) -> float:
+        config = self.config
+        delay = config.latency_ms + self.network_rng.uniform(-config.jitter_ms, config.jitter_ms)
+        if self.network_rng.random() < config.reorder_rate:
+            delay += self.network_rng.uniform(0, 2 * config.latency_ms)
+        return max(delay, 0.0)
+
+    def transmit(self, sender: _Peer, receiver_id: str, turn: int, command: Command, attempt: int = 0) -> None:
+        self.messages_sent += 1
+        receiver = self.peers[sender.game][receiver_id]
+        if self.network_rng.random() >= self.config.drop_rate:
+            self.loop.call_at(self.loop.now + self._delay(), lambda: receiver.deliver(sender, turn, command))
+        else:
+            self.messages_dropped += 1
+
+        def retransmit() -> None:
+            if (receiver_id, turn) not in sender.unacked:
+                return
+            if attempt >= self.config.max_retransmits:
+                sender.unacked.discard((receiver_id, turn))
+                self.abandoned += 1
+                return
+            self.retransmits += 1
+            self.transmit(sender, receiver_id, turn, command, attempt + 1)
+
+        self.loop.call_at(self.loop.now + self.config.retransmit_ms, retransmit)
+
+    def acknowledge(self, receiver: _Peer, sender: _Peer, turn: int) -> None:
+        key = (receiver.player_id, turn)
+        self.loop.call_at(self.loop.now + self._delay(), lambda: sender.unacked.discard(key))
+
+    def record_turn(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.last_turn_at = self.loop.now
+
+    def report_rejected(self) -> None:
+        self.rejected += 1
+
+    def run(self) -> LoadTestReport:
+        started = time.perf_counter()
+        for game_peers in self.peers.values():
+            for peer in game_peers.values():
+                peer.start_turn()
+        self.loop.run()
+        wall = time.perf_counter() - started
+
+        stalled, desynced = [], []
+        for game, game_peers in self.peers.items():
+            standings = [peer.manager.standings() for peer in game_peers.values()]
+            if any(peer.manager.turn_index < self.config.turns for peer in game_peers.values()):
+                stalled.append(game)
+            elif any(entry != standings[0] for entry in standings):
+                desynced.append(game)
+
+        ordered = sorted(self.latencies)
+        return LoadTestReport(
+            turns_completed=len(ordered),
+            latency_percentiles={
+                "p50": percentile(ordered, 0.50),
+                "p90": percentile(ordered, 0.90),
+                "p99": percentile(ordered, 0.99),
+                "max": ordered[-1] if ordered else 0.0,
+            },
+            virtual_duration_ms=self.last_turn_at,
+            wall_seconds=wall,
+            messages_sent=self.messages_sent,
+            messages_dropped=self.messages_dropped,
+            retransmits=self.retransmits,
+            abandoned=self.abandoned,
+            rejected=self.rejected,
+            stalled_games=stalled,
+            desynced_games=desynced,
+        )
+
+
+def run_load_test(config: LoadTestConfig) -> LoadTestReport:
+    """Play ``config.games`` lockstep matches over the simulated network."""
+
+    if config.peers < 2:
+        raise ValueError(f"Lockstep load needs at least two peers: {config.peers}")
+    if not 0 <= config.drop_rate < 1:
+        raise ValueError(f"Drop rate must be in [0, 1): {config.drop_rate}")
+    if config.max_retransmits < 0:
+        raise ValueError(f"Retransmit limit must be non-negative: {config.max_retransmits}")
+    return _LoadHarness(config).run()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--peers", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=GameManager.TURN_LIMIT)
+    parser.add_argument("--latency", type=float, default=40.0, help="mean one-way latency in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="+/- jitter in ms")
+    parser.add_argument("--reorder", type=float, default=0.0, help="probability of holding a message back")
+    parser.add_argument("--drop", type=float, default=0.0, help="probability of dropping a command")
+    parser.add_argument("--retransmit", type=float, default=200.0, help="retransmit timeout in ms")
+    parser.add_argument("--max-retransmits", type=int, default=20, help="resends before giving up on a command")
+    parser.add_argument("--think", type=float, default=5.0, help="local time per turn in ms")
+    parser.add_argument("--window", type=int, default=DEFAULT_TURN_WINDOW)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        LoadTestConfig(
+            games=args.games,
+            peers=args.peers,
+            turns=args.turns,
+            latency_ms=args.latency,
+            jitter_ms=args.jitter,
+            reorder_rate=args.reorder,
+            drop_rate=args.drop,
+            retransmit_ms=args.retransmit,
+            max_retransmits=args.max_retransmits,
+            think_ms=args.think,
+            window_size=args.window,
+            seed=args.seed,
+        )
+    )
+    print(report.summary())
+    return 1 if report.stalled_games or report.desynced_games else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,29 +1,37 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, Iterable, List, Sequence
+from typing import Iterable, List, Sequence
 
 from .models import Command
+from .turn_window import DEFAULT_TURN_WINDOW, TurnWindow
 
 
 class NetSession:
     """Tracks lockstep command exchange and replay validation."""
 
-    def __init__(self, player_order: Sequence[str]):
+    def __init__(self, player_order: Sequence[str], window_size: int = DEFAULT_TURN_WINDOW):
         self._player_order = list(player_order)
         self._outgoing: List[Command] = []
-        self._incoming: Dict[int, List[Command]] = defaultdict(list)
+        self._incoming: TurnWindow[Command] = TurnWindow(window_size)
         self._replay_log: List[List[Command]] = []
 
+    @property
+    def window_size(self) -> int:
+        return self._incoming.size
+
     def send_command(self, command: Command) -> None:
         """Stage a command to send to peers."""
 
         self._outgoing.append(command)
 
     def receive_command(self, turn_index: int, command: Command) -> None:
-        """Record a command received from the network for the specified turn."""
+        """Record a command received from the network for the specified turn.
+
+        Raises:
+            ValueError: If ``turn_index`` is already collected or too far ahead.
+        """
 
-        self._incoming[turn_index].append(command)
+        self._incoming.append(turn_index, command)
 
     def pop_outgoing(self) -> List[Command]:
         """Return staged outgoing commands and clear the send buffer."""
@@ -37,7 +45,7 @@ class NetSession:
 
         priority = {player: index for index, player in enumerate(self._player_order)}
         commands = sorted(
-            self._incoming.pop(turn_index, []),
+            self._incoming.pop(turn_index),
             key=lambda cmd: priority.get(cmd.player_id, len(priority)),
         )
         self._replay_log.append(commands)
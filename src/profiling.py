@@ -0,0 +1,436 @@
+"""Profile seeded simulation workloads by subsystem, action and role.
+
+Every AI planning call and every resolved command runs inside a ``(role, action)``
+scope. Inside a scope, time is attributed to the rules subsystem whose code was
+running (``CombatResolver``, ``EventResolver``, ``ShopManager``, the AI, ...).
+
+``python -m src.profiling --games 20 --output run.folded`` writes folded stacks
+that ``flamegraph.pl`` or speedscope can render directly.
+"""
+from __future__ import annotations
+
+import argparse
+import cProfile
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import CodeType
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from dungeon.entities import Character, Role
+from dungeon.resolvers import CombatResolver, EventResolver
+from dungeon.shop import ShopManager
+from dungeon_ai.agent import AgentDecisionMaker
+from dungeon_ai.roles import get_role_priorities
+
+from .game_manager import GameManager
+from .models import ActionResult, Command
+from .net_session import NetSession
+from .simulation import RULES_MODES, Simulation, SimulationConfig
+from .turn_controller import TurnController
+from .turn_window import TurnWindow
+
+PROFILE_MODES = ("deterministic", "sampling")
+PLAN_ACTION = "plan"
+OTHER_SUBSYSTEM = "other"
+
+# Owners whose code is reported as a subsystem of its own.
+_SUBSYSTEM_OWNERS = (
+    CombatResolver,
+    EventResolver,
+    ShopManager,
+    AgentDecisionMaker,
+    Character,
+    GameManager,
+    TurnController,
+    NetSession,
+    TurnWindow,
+    Simulation,
+)
+
+CodeKey = Tuple[str, int, str]
+Function = Union[CodeType, str]
+Charges = Dict[str, Tuple[float, float]]
+CallGraph = Dict[Function, Tuple[int, float, Dict[Function, Tuple[int, float]]]]
+ScopeKey = Tuple[str, str]
+StackKey = Tuple[str, str, str, str]
+
+
+def _code_key(code) -> CodeKey:
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+def _subsystem_aliases(rules: str) -> Dict[type, type]:
+    """Rule variants reported under the subsystem they stand in for."""
+
+    if rules != "fixed":
+        return {}
+    # The fixed-point rules are opt-in and only imported when profiled.
+    from dungeon.fixed_point import FixedPointCombatResolver, FixedPointEventResolver, FixedPointShopManager
+
+    return {
+        FixedPointCombatResolver: CombatResolver,
+        FixedPointEventResolver: EventResolver,
+        FixedPointShopManager: ShopManager,
+    }
+
+
+def _build_subsystem_index(rules: str = "float") -> Dict[CodeKey, str]:
+    index: Dict[CodeKey, str] = {}
+    owners = [(owner, owner) for owner in _SUBSYSTEM_OWNERS] + list(_subsystem_aliases(rules).items())
+    for owner, reported in owners:
+        for attribute in vars(owner).values():
+            if isinstance(attribute, (staticmethod, classmethod)):
+                attribute = attribute.__func__
+            elif isinstance(attribute, property):
+                attribute = attribute.fget
+            code = getattr(attribute, "__code__", None)
+            # Generated code (dataclass ``__init__``/``__eq__``...) shares the key
+            # ("<string>", 2, name) across classes, so it is attributed to its caller.
+            if code is not None and not code.co_filename.startswith("<"):
+                index[_code_key(code)] = reported.__name__
+    index[_code_key(get_role_priorities.__code__)] = AgentDecisionMaker.__name__
+    return index
+
+
+@dataclass(slots=True)
+class ProfileConfig:
+    """Seeded workload description for the profiling harness.
+
+    Attributes:
+        seed: Seed of the first game; game ``n`` uses ``seed + n``.
+        games: Number of games to play.
+        roles: Roles seated in every game.
+        turn_limit: Turns per game.
+        mode: ``"deterministic"`` (cProfile) or ``"sampling"`` (stack sampling thread).
+        sample_interval: Seconds between samples in sampling mode.
+        rules: Rules mode passed to :class:`SimulationConfig`.
+    """
+
+    seed: int = 0
+    games: int = 10
+    roles: Tuple[Role, ...] = tuple(Role)
+    turn_limit: int = GameManager.TURN_LIMIT
+    mode: str = "deterministic"
+    sample_interval: float = 0.0005
+    rules: str = "float"
+
+
+@dataclass(slots=True)
+class StackStats:
+    calls: int = 0
+    time_ns: int = 0
+
+    def add(self, calls: int, time_ns: int) -> None:
+        self.calls += calls
+        self.time_ns += time_ns
+
+
+@dataclass
+class ProfileReport:
+    """Profiling output.
+
+    Attributes:
+        mode: Profiling mode that produced the report.
+        scopes: Wall time and invocation count per ``(role, action)`` scope.
+        stacks: Time per ``(role, action, subsystem, function)``. In deterministic
+            mode ``calls`` are call counts, with calls to shared helpers split
+            between the calling subsystems; in sampling mode they are sample
+            counts.
+    """
+
+    mode: str
+    scopes: Dict[ScopeKey, StackStats] = field(default_factory=dict)
+    stacks: Dict[StackKey, StackStats] = field(default_factory=dict)
+
+    def totals_by(self, dimension: str) -> Dict[str, StackStats]:
+        """Aggregate ``stacks`` by ``"role"``, ``"action"``, ``"subsystem"`` or ``"function"``."""
+
+        try:
+            position = ("role", "action", "subsystem", "function").index(dimension)
+        except ValueError as exc:
+            raise ValueError(f"Unknown dimension: {dimension}") from exc
+
+        totals: Dict[str, StackStats] = {}
+        for key, stats in self.stacks.items():
+            totals.setdefault(key[position], StackStats()).add(stats.calls, stats.time_ns)
+        return totals
+
+    def to_folded(self) -> str:
+        """Render ``role;action;subsystem;function microseconds`` lines for flamegraph tools."""
+
+        lines = []
+        for key, stats in sorted(self.stacks.items()):
+            micros = stats.time_ns // 1000
+            if micros > 0:
+                lines.append(f"{';'.join(key)} {micros}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> str:
+        rows: List[str] = []
+        for dimension in ("subsystem", "action", "role"):
+            rows.append(f"by {dimension}:")
+            totals = sorted(self.totals_by(dimension).items(), key=lambda item: -item[1].time_ns)
+            for name, stats in totals:
+                rows.append(f"  {name:<20} {stats.time_ns / 1e6:>10.3f} ms {stats.calls:>10} calls")
+        return "\n".join(rows)
+
+
+class _Profiler:
+    """Scope bookkeeping shared by both profiling modes."""
+
+    def __init__(self, mode: str, rules: str) -> None:
+        self.report = ProfileReport(mode=mode)
+        self.subsystems = _build_subsystem_index(rules)
+
+    @contextmanager
+    def scope(self, role: str, action: str) -> Iterator[None]:
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            self.report.scopes.setdefault((role, action), StackStats()).add(1, elapsed)
+
+    def start(self) -> None:
+        pass
+
+    def finish(self) -> ProfileReport:
+        return self.report
+
+
+class _DeterministicProfiler(_Profiler):
+    """One ``cProfile.Profile`` per scope, enabled only while the scope runs."""
+
+    def __init__(self, rules: str) -> None:
+        super().__init__("deterministic", rules)
+        self._profiles: Dict[ScopeKey, cProfile.Profile] = {}
+
+    @contextmanager
+    def scope(self, role: str, action: str) -> Iterator[None]:
+        profile = self._profiles.setdefault((role, action), cProfile.Profile())
+        with super().scope(role, action):
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+
+    def finish(self) -> ProfileReport:
+        for (role, action), profile in self._profiles.items():
+            graph = _call_graph(profile)
+            charges: Dict[Function, Charges] = {}
+            for function in graph:
+                for subsystem, (calls, self_time) in self._charges(function, graph, charges, set()).items():
+                    stack = (role, action, subsystem, _function_name(function))
+                    self.report.stacks.setdefault(stack, StackStats()).add(round(calls), int(self_time * 1e9))
+        return self.report
+
+    def _subsystem(self, function: Function) -> Optional[str]:
+        if isinstance(function, str):
+            return None
+        return self.subsystems.get(_code_key(function))
+
+    def _charges(
+        self, function: Function, graph: CallGraph, charges: Dict[Function, Charges], visiting: set
+    ) -> Charges:
+        """Split a function's calls and self time across subsystems.
+
+        Builtins, stdlib helpers (``random``, ``max``...) and generated dataclass
+        code have no subsystem of their own. cProfile keeps their calls and self
+        time per caller, so each caller's part is charged to the caller's
+        subsystems in proportion.
+        """
+
+        if function in charges:
+            return charges[function]
+        calls, self_time, callers = graph[function]
+        owner = self._subsystem(function)
+        if owner is not None:
+            return charges.setdefault(function, {owner: (calls, self_time)})
+
+        visiting.add(function)
+        split: Charges = {}
+        for caller, (caller_calls, caller_time) in callers.items():
+            for subsystem, fraction in self._shares(caller, graph, charges, visiting).items():
+                charged_calls, charged_time = split.get(subsystem, (0.0, 0.0))
+                split[subsystem] = (charged_calls + caller_calls * fraction, charged_time + caller_time * fraction)
+        visiting.discard(function)
+        return charges.setdefault(function, split or {OTHER_SUBSYSTEM: (calls, self_time)})
+
+    def _shares(
+        self, function: Function, graph: CallGraph, charges: Dict[Function, Charges], visiting: set
+    ) -> Dict[str, float]:
+        """Fraction of a caller's time (or calls, if it took no measurable time) per subsystem."""
+
+        owner = self._subsystem(function)
+        if owner is not None:
+            return {owner: 1.0}
+        if function in visiting or function not in graph:
+            return {OTHER_SUBSYSTEM: 1.0}
+
+        split = self._charges(function, graph, charges, visiting)
+        total_time = sum(charged_time for _, charged_time in split.values())
+        if total_time > 0:
+            return {subsystem: charged_time / total_time for subsystem, (_, charged_time) in split.items()}
+        total_calls = sum(charged_calls for charged_calls, _ in split.values())
+        if total_calls > 0:
+            return {subsystem: charged_calls / total_calls for subsystem, (charged_calls, _) in split.items()}
+        return {OTHER_SUBSYSTEM: 1.0}
+
+
+def _call_graph(profile: cProfile.Profile) -> CallGraph:
+    """Calls, self time and per-caller breakdown of every function a profile saw.
+
+    ``pstats`` keys functions by ``(file, line, name)`` and keeps only one of the
+    generated dataclass ``__init__`` methods that share ``("<string>", 2,
+    "__init__")``, so the raw entries are read by code object instead.
+    """
+
+    graph: CallGraph = {}
+    for entry in profile.getstats():
+        calls, self_time, callers = graph.get(entry.code, (0, 0.0, {}))
+        graph[entry.code] = (calls + entry.callcount, self_time + entry.inlinetime, callers)
+    for entry in profile.getstats():
+        for callee in entry.calls or ():
+            callers = graph[callee.code][2]
+            caller_calls, caller_time = callers.get(entry.code, (0, 0.0))
+            callers[entry.code] = (caller_calls + callee.callcount, caller_time + callee.inlinetime)
+    return graph
+
+
+def _function_name(function: Function) -> str:
+    # Builtins are reported by label, e.g. "<built-in method builtins.max>".
+    return function if isinstance(function, str) else function.co_name
+
+
+class _SamplingProfiler(_Profiler):
+    """Background thread that samples the simulation thread's stack."""
+
+    def __init__(self, interval: float, rules: str) -> None:
+        super().__init__("sampling", rules)
+        self._interval = interval
+        self._current: Optional[ScopeKey] = None
+        self._target_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._switch_interval = sys.getswitchinterval()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+
+    @contextmanager
+    def scope(self, role: str, action: str) -> Iterator[None]:
+        with super().scope(role, action):
+            self._current = (role, action)
+            try:
+                yield
+            finally:
+                self._current = None
+
+    def start(self) -> None:
+        # The sampler needs the GIL at least once per interval to take a sample.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self._interval / 2))
+        self._thread.start()
+
+    def finish(self) -> ProfileReport:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        return self.report
+
+    def _sample_loop(self) -> None:
+        previous = time.perf_counter_ns()
+        while not self._stop.wait(self._interval):
+            now = time.perf_counter_ns()
+            weight, previous = now - previous, now
+            scope = self._current
+            frame = sys._current_frames().get(self._target_thread)
+            if scope is None or frame is None:
+                continue
+
+            function = frame.f_code.co_name
+            subsystem = OTHER_SUBSYSTEM
+            while frame is not None:
+                owner = self.subsystems.get(_code_key(frame.f_code))
+                if owner is not None:
+                    subsystem = owner
+                    break
+                frame = frame.f_back
+
+            stack = (scope[0], scope[1], subsystem, function)
+            self.report.stacks.setdefault(stack, StackStats()).add(1, weight)
+
+
+class _ProfiledSimulation(Simulation):
+    def __init__(self, config: SimulationConfig, profiler: _Profiler) -> None:
+        self._profiler = profiler
+        super().__init__(config)
+
+    def plan_command(self, player_id: str) -> Command:
+        with self._profiler.scope(self.characters[player_id].role.value, PLAN_ACTION):
+            return super().plan_command(player_id)
+
+    def resolve_command(self, command: Command, turn_index: int) -> ActionResult:
+        with self._profiler.scope(self.characters[command.player_id].role.value, command.action):
+            return super().resolve_command(command, turn_index)
+
+
+def profile_workload(config: ProfileConfig) -> ProfileReport:
+    """Play ``config.games`` seeded games and return the attributed profile."""
+
+    if config.mode == "deterministic":
+        profiler: _Profiler = _DeterministicProfiler(config.rules)
+    elif config.mode == "sampling":
+        profiler = _SamplingProfiler(config.sample_interval, config.rules)
+    else:
+        raise ValueError(f"Unsupported profile mode: {config.mode}")
+
+    profiler.start()
+    try:
+        for game in range(config.games):
+            simulation_config = SimulationConfig(
+                seed=config.seed + game, roles=config.roles, turn_limit=config.turn_limit, rules=config.rules
+            )
+            _ProfiledSimulation(simulation_config, profiler).run()
+    finally:
+        report = profiler.finish()
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=GameManager.TURN_LIMIT)
+    parser.add_argument("--roles", nargs="+", choices=[role.value for role in Role], default=None)
+    parser.add_argument("--mode", choices=PROFILE_MODES, default="deterministic")
+    parser.add_argument("--rules", choices=RULES_MODES, default="float")
+    parser.add_argument("--interval", type=float, default=0.0005, help="sampling interval in seconds")
+    parser.add_argument("--output", help="write folded stacks to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    roles = tuple(Role(value) for value in args.roles) if args.roles else tuple(Role)
+    report = profile_workload(
+        ProfileConfig(
+            seed=args.seed,
+            games=args.games,
+            roles=roles,
+            turn_limit=args.turns,
+            mode=args.mode,
+            sample_interval=args.interval,
+            rules=args.rules,
+        )
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report.to_folded())
+        print(report.summary())
+    else:
+        sys.stdout.write(report.to_folded())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,461 @@
+"""Columnar archive of finished games and a grouped-aggregate query engine.
+
+Each game is one ``.ddr`` file::
+
+    b"DDR1\\n" | header length (uint32 LE) | JSON header | column blocks
+
+The header lists every table, its row count and, per column, the byte range of
+its block. Integer columns are little-endian int64 arrays; string columns are
+dictionary-encoded int32 codes with the dictionary kept in the header. A query
+therefore seeks to and decodes only the columns it touches, and groups and
+filters on dictionary codes without materialising strings per row.
+
+Tables:
+    turns: one row per resolved action (``turn_index``, ``player_id``, ``role``,
+        ``action``, ``outcome``, ``vp_delta``, ``gold``, ``hp``).
+    results: one row per player (``player_id``, ``role``, ``final_vp``, ``won``,
+        ``tied``). ``won`` is 1 for every player on the top score, so a tie
+        counts as a win for each tied player; ``tied`` is 1 when that top score
+        is shared. Filter with ``tied=0`` to count outright wins only.
+
+``python -m src.replay_archive record DIR --games 200`` simulates games into an
+archive; ``python -m src.replay_archive query DIR --table results --group-by role
+--metric won`` answers "which role wins most often".
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .models import ActionResult
+
+MAGIC = b"DDR1\n"
+FORMAT_VERSION = 1
+ARCHIVE_SUFFIX = ".ddr"
+
+# Column name -> "int" or "str", in on-disk order.
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    "turns": {
+        "turn_index": "int",
+        "player_id": "str",
+        "role": "str",
+        "action": "str",
+        "outcome": "str",
+        "vp_delta": "int",
+        "gold": "int",
+        "hp": "int",
+    },
+    "results": {
+        "player_id": "str",
+        "role": "str",
+        "final_vp": "int",
+        "won": "int",
+        "tied": "int",
+    },
+}
+
+_INT_CODE = "q"
+_STR_CODE = "i"
+_HEADER_LENGTH = struct.Struct("<I")
+
+Value = Union[int, str]
+GroupKey = Tuple[Value, ...]
+
+
+def _to_disk(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_disk(typecode: str, raw: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode_table(rows: Sequence[Mapping[str, Value]], schema: Mapping[str, str]) -> Tuple[Dict, List[bytes]]:
+    columns: Dict[str, Dict] = {}
+    blocks: List[bytes] = []
+    for name, kind in schema.items():
+        if kind == "int":
+            block = _to_disk(array(_INT_CODE, (int(row.get(name, 0)) for row in rows)))
+            columns[name] = {"type": kind}
+        else:
+            dictionary: Dict[str, int] = {}
+            codes = array(
+                _STR_CODE, (dictionary.setdefault(str(row.get(name, "")), len(dictionary)) for row in rows)
+            )
+            block = _to_disk(codes)
+            columns[name] = {"type": kind, "dictionary": list(dictionary)}
+        columns[name]["length"] = len(block)
+        blocks.append(block)
+    return {"rows": len(rows), "columns": columns}, blocks
+
+
+def write_game(
+    path: Union[str, Path],
+    history: Iterable[Iterable[ActionResult]],
+    roles: Mapping[str, str],
+    meta: Optional[Mapping[str, object]] = None,
+) -> Path:
+    """Archive one finished game.
+
+    Args:
+        path: Destination file.
+        history: Per-turn results as returned by ``GameManager.run_full_game``.
+            ``role``, ``action``, ``outcome``, ``gold`` and ``hp`` are read from
+            ``ActionResult.events`` when present.
+        roles: Role of every player, used for the ``results`` table.
+        meta: Extra JSON-serialisable game metadata (seed, rules, ...).
+    """
+
+    turn_rows: List[Dict[str, Value]] = []
+    final_vp = {player_id: 0 for player_id in roles}
+    for turn in history:
+        for result in turn:
+            row: Dict[str, Value] = {
+                key: value for key, value in result.events.items() if isinstance(value, (int, str))
+            }
+            row.setdefault("role", roles.get(result.player_id, ""))
+            row.update(turn_index=result.turn_index, player_id=result.player_id, vp_delta=result.vp_delta)
+            turn_rows.append(row)
+            final_vp[result.player_id] = final_vp.get(result.player_id, 0) + result.vp_delta
+
+    best = max(final_vp.values(), default=0)
+    tied = int(sum(vp == best for vp in final_vp.values()) > 1)
+    result_rows = [
+        {
+            "player_id": player_id,
+            "role": roles.get(player_id, ""),
+            "final_vp": vp,
+            "won": int(vp == best),
+            "tied": tied if vp == best else 0,
+        }
+        for player_id, vp in final_vp.items()
+    ]
+
+    tables: Dict[str, Dict] = {}
+    blocks: List[bytes] = []
+    for name, rows in (("turns", turn_rows), ("results", result_rows)):
+        tables[name], table_blocks = _encode_table(rows, TABLE_SCHEMAS[name])
+        blocks.extend(table_blocks)
+
+    # Offsets are relative to the first column block so the header can be sized first.
+    offset = 0
+    for table in tables.values():
+        for column in table["columns"].values():
+            column["offset"] = offset
+            offset += column["length"]
+
+    header = json.dumps(
+        {"version": FORMAT_VERSION, "meta": dict(meta or {}), "tables": tables}, separators=(",", ":")
+    ).encode("utf-8")
+
+    destination = Path(path)
+    with destination.open("wb") as handle:
+        handle.write(MAGIC)
+        handle.write(_HEADER_LENGTH.pack(len(header)))
+        handle.write(header)
+        for block in blocks:
+            handle.write(block)
+    return destination
+
+
+class ReplayFile:
+    """Lazy reader for one archived game; column blocks are read on demand."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a replay archive: {self.path}")
+            (length,) = _HEADER_LENGTH.unpack(handle.read(_HEADER_LENGTH.size))
+            header = json.loads(handle.read(length).decode("utf-8"))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported replay archive version: {header.get('version')}")
+        self.meta: Dict[str, object] = header["meta"]
+        self._tables: Dict[str, Dict] = header["tables"]
+        self._data_start = len(MAGIC) + _HEADER_LENGTH.size + length
+
+    def rows(self, table: str) -> int:
+        return self._table(table)["rows"]
+
+    def _table(self, table: str) -> Dict:
+        try:
+            return self._tables[table]
+        except KeyError as exc:
+            raise ValueError(f"Unknown table: {table}") from exc
+
+    def _column(self, table: str, name: str) -> Dict:
+        try:
+            return self._table(table)["columns"][name]
+        except KeyError as exc:
+            raise ValueError(f"Unknown column {name!r} in table {table!r}") from exc
+
+    def column_type(self, table: str, name: str) -> str:
+        """``"int"`` or ``"str"`` as recorded in the header."""
+
+        return self._column(table, name)["type"]
+
+    def dictionary(self, table: str, name: str) -> List[str]:
+        """Decoded values of a string column, indexed by code."""
+
+        return self._column(table, name).get("dictionary", [])
+
+    def read_raw(self, table: str, names: Iterable[str]) -> Dict[str, array]:
+        """Read only the requested columns; string columns come back as codes."""
+
+        result: Dict[str, array] = {}
+        with self.path.open("rb") as handle:
+            for name in names:
+                column = self._column(table, name)
+                handle.seek(self._data_start + column["offset"])
+                typecode = _INT_CODE if column["type"] == "int" else _STR_CODE
+                result[name] = _from_disk(typecode, handle.read(column["length"]))
+        return result
+
+    def read_columns(self, table: str, names: Iterable[str]) -> Dict[str, List[Value]]:
+        """Read and decode the requested columns."""
+
+        decoded: Dict[str, List[Value]] = {}
+        for name, values in self.read_raw(table, names).items():
+            dictionary = self.dictionary(table, name)
+            decoded[name] = [dictionary[code] for code in values] if dictionary else list(values)
+        return decoded
+
+
+@dataclass(slots=True)
+class Aggregate:
+    count: int = 0
+    total: int = 0
+    minimum: Optional[int] = None
+    maximum: Optional[int] = None
+
+    def add(self, value: int) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def merge(self, other: "Aggregate") -> None:
+        self.count += other.count
+        self.total += other.total
+        if other.minimum is not None:
+            self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        if other.maximum is not None:
+            self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+QueryResult = Dict[GroupKey, Dict[str, Aggregate]]
+
+
+@dataclass(slots=True)
+class _Query:
+    table: str
+    group_by: Tuple[str, ...]
+    metrics: Tuple[str, ...]
+    where: Tuple[Tuple[str, Value], ...]
+
+
+def _scan_file(path: str, query: _Query) -> QueryResult:
+    replay = ReplayFile(path)
+    needed = dict.fromkeys(query.group_by + query.metrics + tuple(name for name, _ in query.where))
+    columns = replay.read_raw(query.table, needed)
+
+    # Filters and group keys work on dictionary codes; strings are decoded per group.
+    filters = []
+    for name, expected in query.where:
+        if replay.column_type(query.table, name) == "str":
+            dictionary = replay.dictionary(query.table, name)
+            if expected not in dictionary:
+                return {}
+            expected = dictionary.index(expected)
+        filters.append((columns[name], expected))
+
+    group_columns = [columns[name] for name in query.group_by]
+    metric_columns = [columns[name] for name in query.metrics]
+    partial: Dict[GroupKey, List[Aggregate]] = {}
+    for row in range(replay.rows(query.table)):
+        if any(column[row] != expected for column, expected in filters):
+            continue
+        key = tuple(column[row] for column in group_columns)
+        aggregates = partial.get(key)
+        if aggregates is None:
+            aggregates = partial[key] = [Aggregate() for _ in metric_columns]
+        for aggregate, column in zip(aggregates, metric_columns):
+            aggregate.add(column[row])
+
+    dictionaries = [
+        replay.dictionary(query.table, name) if replay.column_type(query.table, name) == "str" else None
+        for name in query.group_by
+    ]
+    result: QueryResult = {}
+    for codes, aggregates in partial.items():
+        key = tuple(
+            code if dictionary is None else dictionary[code] for dictionary, code in zip(dictionaries, codes)
+        )
+        result[key] = dict(zip(query.metrics, aggregates))
+    return result
+
+
+def _scan_chunk(paths: List[str], query: _Query) -> QueryResult:
+    merged: QueryResult = {}
+    for path in paths:
+        _merge_into(merged, _scan_file(path, query))
+    return merged
+
+
+def _merge_into(target: QueryResult, partial: QueryResult) -> None:
+    for key, aggregates in partial.items():
+        existing = target.setdefault(key, {})
+        for metric, aggregate in aggregates.items():
+            existing.setdefault(metric, Aggregate()).merge(aggregate)
+
+
+def archive_paths(directory: Union[str, Path]) -> List[Path]:
+    return sorted(Path(directory).glob(f"*{ARCHIVE_SUFFIX}"))
+
+
+def query(
+    paths: Iterable[Union[str, Path]],
+    table: str = "turns",
+    group_by: Sequence[str] = ("role",),
+    metrics: Sequence[str] = ("vp_delta",),
+    where: Optional[Mapping[str, Value]] = None,
+    workers: int = 0,
+) -> QueryResult:
+    """Compute grouped count/sum/min/max/mean over many archived games.
+
+    Only ``group_by``, ``metrics`` and ``where`` columns are read from disk.
+    ``where`` keeps rows whose columns equal the given values. With ``workers > 0``
+    files are scanned in a process pool and the partial aggregates merged.
+
+    Example: mean gold per role at turn 20::
+
+        query(paths, group_by=["role"], metrics=["gold"], where={"turn_index": 20})
+    """
+
+    schema = TABLE_SCHEMAS.get(table)
+    if schema is None:
+        raise ValueError(f"Unknown table: {table}")
+    spec = _Query(table, tuple(group_by), tuple(metrics), tuple((where or {}).items()))
+    for name in spec.group_by + spec.metrics + tuple(name for name, _ in spec.where):
+        if name not in schema:
+            raise ValueError(f"Unknown column {name!r} in table {table!r}")
+    for name in spec.metrics:
+        if schema[name] != "int":
+            raise ValueError(f"Metric column must be numeric: {name}")
+    for name, value in spec.where:
+        expected_type = int if schema[name] == "int" else str
+        if not isinstance(value, expected_type) or isinstance(value, bool):
+            raise ValueError(f"Filter on {name!r} expects {schema[name]}, got {value!r}")
+
+    files = [str(path) for path in paths]
+    if workers <= 0 or len(files) <= 1:
+        return _scan_chunk(files, spec)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_count = min(len(files), workers * 4)
+    chunks = [files[index::chunk_count] for index in range(chunk_count)]
+    merged: QueryResult = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(_scan_chunk, chunks, [spec] * len(chunks)):
+            _merge_into(merged, partial)
+    return merged
+
+
+def _record(args: argparse.Namespace) -> int:
+    from .simulation import SimulationConfig, SimulationRunner
+
+    directory = Path(args.directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    configs = [SimulationConfig(seed=args.seed + game, rules=args.rules) for game in range(args.games)]
+    with SimulationRunner(workers=args.workers) as runner:
+        for config, result in zip(configs, runner.run_batch(configs)):
+            write_game(
+                directory / f"game-{config.seed:08d}{ARCHIVE_SUFFIX}",
+                result.history,
+                result.roles,
+                meta={"seed": config.seed, "rules": config.rules},
+            )
+    print(f"recorded {args.games} games into {directory}")
+    return 0
+
+
+def _parse_where(table: str, items: Sequence[str]) -> Dict[str, Value]:
+    schema = TABLE_SCHEMAS[table]
+    where: Dict[str, Value] = {}
+    for item in items:
+        name, _, raw = item.partition("=")
+        if schema.get(name) == "int":
+            try:
+                where[name] = int(raw)
+            except ValueError as exc:
+                raise ValueError(f"Filter on {name!r} expects int, got {raw!r}") from exc
+        else:
+            where[name] = raw
+    return where
+
+
+def _query(args: argparse.Namespace) -> int:
+    result = query(
+        archive_paths(args.directory),
+        table=args.table,
+        group_by=args.group_by,
+        metrics=args.metric,
+        where=_parse_where(args.table, args.where),
+        workers=args.workers,
+    )
+    for key, aggregates in sorted(result.items(), key=lambda item: tuple(map(str, item[0]))):
+        cells = "  ".join(
+            f"{metric}: n={agg.count} sum={agg.total} mean={agg.mean:.2f} min={agg.minimum} max={agg.maximum}"
+            for metric, agg in aggregates.items()
+        )
+        print(f"{'/'.join(map(str, key)) or '*'}  {cells}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from .simulation import RULES_MODES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="simulate games into an archive directory")
+    record.add_argument("directory")
+    record.add_argument("--games", type=int, default=100)
+    record.add_argument("--seed", type=int, default=0)
+    record.add_argument("--rules", choices=RULES_MODES, default="float")
+    record.add_argument("--workers", type=int, default=0)
+    record.set_defaults(handler=_record)
+
+    run = commands.add_parser("query", help="grouped aggregates over an archive directory")
+    run.add_argument("directory")
+    run.add_argument("--table", choices=sorted(TABLE_SCHEMAS), default="turns")
+    run.add_argument("--group-by", nargs="*", default=["role"])
+    run.add_argument("--metric", nargs="+", default=["vp_delta"])
+    run.add_argument("--where", nargs="*", default=[], help="column=value equality filters")
+    run.add_argument("--workers", type=int, default=0)
+    run.set_defaults(handler=_query)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dungeon.entities import Character, Role
+from dungeon.resolvers import CombatResolver, EventResolver, EventType
+from dungeon.shop import ShopManager
+from dungeon_ai.agent import AgentDecisionMaker, AgentState, TileInfo
+from dungeon_ai.roles import Role as AgentRole
+
+from .game_manager import GameManager
+from .models import ActionResult, Command
+
+# Base stats per archetype: (attack, defense, luck, hp, gold)
+ROLE_BASE_STATS: Dict[Role, Tuple[int, int, int, int, int]] = {
+    Role.WARRIOR: (14, 6, 20, 60, 0),
+    Role.MAGE: (16, 2, 25, 40, 0),
+    Role.HUNTER: (12, 4, 30, 45, 0),
+    Role.ROGUE: (10, 3, 45, 45, 0),
+    Role.MERCHANT: (8, 3, 35, 45, 30),
+    Role.CLERIC: (9, 5, 30, 55, 0),
+}
+
+# The AI has no merchant profile; rogues are the closest economy-driven fit.
+AGENT_ROLES: Dict[Role, AgentRole] = {
+    Role.WARRIOR: AgentRole.WARRIOR,
+    Role.MAGE: AgentRole.MAGE,
+    Role.HUNTER: AgentRole.HUNTER,
+    Role.ROGUE: AgentRole.ROGUE,
+    Role.MERCHANT: AgentRole.ROGUE,
+    Role.CLERIC: AgentRole.CLERIC,
+}
+
+TRAP_PROBABILITY = 0.3
+
+# "float" uses the reference resolvers; "fixed" the bit-exact Q16 integer variants.
+RULES_MODES = ("float", "fixed")
+
+
+@dataclass(slots=True)
+class SimulationConfig:
+    """Seeded description of a headless game.
+
+    Attributes:
+        seed: Seed shared by every resolver so the game is reproducible.
+        roles: One entry per player; players are named ``p1``, ``p2``, ...
+        turn_limit: Number of turns to play.
+        tiles_per_turn: Candidate tiles offered to the AI each turn.
+        rules: One of :data:`RULES_MODES`.
+    """
+
+    seed: int = 0
+    roles: Tuple[Role, ...] = (Role.WARRIOR, Role.MAGE, Role.HUNTER, Role.ROGUE)
+    turn_limit: int = GameManager.TURN_LIMIT
+    tiles_per_turn: int = 4
+    rules: str = "float"
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    seed: int
+    roles: Dict[str, str]
+    standings: Dict[str, int]
+    history: List[List[ActionResult]] = field(default_factory=list)
+
+
+class Simulation:
+    """Plays one game end to end with the dungeon rules and the role AI.
+
+    Each turn the AI picks a movement or safety action per player, which is turned
+    into a :class:`Command` and resolved through :class:`GameManager`.
+    """
+
+    def __init__(self, config: SimulationConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        # Resolver probabilities per 1.0; the fixed-point rules report Q16 integers.
+        self.chance_scale = 1
+        if config.rules == "float":
+            self.combat = CombatResolver(self.rng)
+            self.events = EventResolver(self.rng)
+            self.shop = ShopManager()
+        elif config.rules == "fixed":
+            # Opt-in rules mode, imported on demand to keep startup lean.
+            from dungeon.fixed_point import (
+                FIXED_ONE,
+                FixedPointCombatResolver,
+                FixedPointEventResolver,
+                FixedPointShopManager,
+            )
+
+            self.combat = FixedPointCombatResolver(self.rng)
+            self.events = FixedPointEventResolver(self.rng)
+            self.shop = FixedPointShopManager()
+            self.chance_scale = FIXED_ONE
+        else:
+            raise ValueError(f"Unsupported rules mode: {config.rules}")
+
+        self.characters: Dict[str, Character] = {}
+        self.max_hp: Dict[str, int] = {}
+        self.agents: Dict[str, AgentDecisionMaker] = {}
+        self.positions: Dict[str, Tuple[int, int]] = {}
+        for index, role in enumerate(config.roles):
+            player_id = f"p{index + 1}"
+            attack, defense, luck, hp, gold = ROLE_BASE_STATS[role]
+            self.characters[player_id] = Character(player_id, role, attack, defense, luck, hp, gold)
+            self.max_hp[player_id] = hp
+            self.agents[player_id] = AgentDecisionMaker(AGENT_ROLES[role])
+            self.positions[player_id] = (0, 0)
+
+        self.manager = GameManager(
+            list(self.characters), action_resolver=self.resolve_command, turn_limit=config.turn_limit
+        )
+
+    def _offer_tiles(self, current: Tuple[int, int]) -> List[TileInfo]:
+        x, y = current
+        tiles = []
+        for _ in range(self.config.tiles_per_turn):
+            position = (x + self.rng.randint(-2, 2), y + self.rng.randint(-2, 2))
+            tiles.append(
+                TileInfo(
+                    position=position,
+                    value=self.rng.uniform(0, 10),
+                    danger=self.rng.random(),
+                    is_visible=self.rng.random() < 0.85,
+                )
+            )
+        return tiles
+
+    def plan_command(self, player_id: str) -> Command:
+        """Ask the AI for a decision and translate it into a rules action."""
+
+        character = self.characters[player_id]
+        if character.hp <= 0:
+            return Command(player_id, "rest")
+
+        state = AgentState(
+            hp=character.hp,
+            max_hp=self.max_hp[player_id],
+            trap_probability=TRAP_PROBABILITY,
+            escape_success_probability=self.combat.escape_chance(character.luck, 1) / self.chance_scale,
+        )
+        current = self.positions[player_id]
+        decision = self.agents[player_id].choose_safety_action(state, current, self._offer_tiles(current))
+        target: Optional[TileInfo] = decision["target"]  # type: ignore[assignment]
+        if target is None:
+            return Command(player_id, "rest")
+
+        self.positions[player_id] = target.position
+        threat = 1 + int(target.danger * 3)
+        if decision["action"] == "heal":
+            action = EventType.SIDE_QUEST.value
+        elif decision["action"] == "fallback":
+            can_exchange = character.gold >= self.shop.BASE_EXCHANGE_RATE
+            action = "shop" if can_exchange else EventType.SIDE_QUEST.value
+        elif target.danger >= 0.6:
+            action = "combat"
+        elif target.danger >= 0.35:
+            action = EventType.TRAP.value
+        else:
+            action = EventType.CHEST.value
+        return Command(player_id, action, {"threat": threat})
+
+    def resolve_command(self, command: Command, turn_index: int) -> ActionResult:
+        """``GameManager`` action resolver applying the dungeon rules."""
+
+        character = self.characters[command.player_id]
+        vp_delta = 0
+        outcome = ""
+
+        if command.action == "combat":
+            threat = int(command.payload.get("threat", 1))
+            monster = Character("monster", Role.WARRIOR, 6 + 2 * threat, 2 + threat, 0, 15 + 5 * threat)
+            can_escape = character.hp < self.max_hp[command.player_id] // 2
+            result = self.combat.resolve_turn(character, monster, can_escape=can_escape, threat_level=threat)
+            if result.escaped:
+                outcome = "escaped"
+            elif monster.hp <= 0:
+                character.adjust_gold(10 * threat)
+                character.vp += threat
+                vp_delta = threat
+                outcome = "victory"
+            else:
+                self.combat.resolve_attack(monster, character)
+                outcome = "exchange"
+        elif command.action == "shop":
+            transaction = self.shop.exchange_gold_for_vp(character)
+            vp_delta = transaction.vp_gained
+            outcome = "exchanged" if transaction.success else "declined"
+        elif command.action == "rest":
+            character.heal(self.max_hp[command.player_id] // 4)
+            outcome = "rested"
+        else:
+            outcome = self.events.resolve(EventType(command.action), character).outcome
+
+        return ActionResult(
+            player_id=command.player_id,
+            turn_index=turn_index,
+            vp_delta=vp_delta,
+            events={
+                "role": character.role.value,
+                "action": command.action,
+                "outcome": outcome,
+                "gold": character.gold,
+                "hp": character.hp,
+            },
+        )
+
+    def run(self) -> SimulationResult:
+        history: List[List[ActionResult]] = []
+        while self.manager.turn_index < self.manager.turn_limit:
+            self.manager.enqueue_commands([self.plan_command(player_id) for player_id in self.characters])
+            history.append(self.manager.resolve_current_turn())
+
+        return SimulationResult(
+            seed=self.config.seed,
+            roles={player_id: character.role.value for player_id, character in self.characters.items()},
+            standings=self.manager.standings(),
+            history=history,
+        )
+
+
+def run_simulation(config: SimulationConfig) -> SimulationResult:
+    return Simulation(config).run()
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay import and first-call costs before real work arrives."""
+
+    run_simulation(SimulationConfig(turn_limit=1))
+
+
+class SimulationRunner:
+    """Runs batches of simulations inline or on a pool of warm worker processes.
+
+    With ``workers > 0`` the pool is created once (forked where the platform allows)
+    and reused for every batch, so process startup is paid once per runner rather
+    than once per game. ``multiprocessing`` is only imported when a pool is needed.
+    """
+
+    def __init__(self, workers: int = 0, warm: bool = True) -> None:
+        if workers < 0:
+            raise ValueError(f"Worker count cannot be negative: {workers}")
+        self.workers = workers
+        self.warm = warm
+        self._pool = None
+
+    def start(self) -> None:
+        if self.workers == 0 or self._pool is not None:
+            return
+
+        import multiprocessing
+
+        method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+        context = multiprocessing.get_context(method)
+        self._pool = context.Pool(self.workers, initializer=_warm_worker if self.warm else None)
+
+    def run_batch(self, configs: Iterable[SimulationConfig]) -> List[SimulationResult]:
+        batch = list(configs)
+        if self.workers == 0:
+            return [run_simulation(config) for config in batch]
+
+        self.start()
+        chunksize = max(1, len(batch) // (self.workers * 4))
+        return self._pool.map(run_simulation, batch, chunksize)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "SimulationRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
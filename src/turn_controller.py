@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, Sequence
+from typing import Callable, Iterable, List, Sequence
 
 from .models import ActionResult, Command
+from .turn_window import DEFAULT_TURN_WINDOW, TurnWindow
 
 
 @dataclass(slots=True)
@@ -18,31 +18,41 @@ class TurnController:
 
     The controller is agnostic to the concrete game rules. It delegates per-action
     resolution to ``action_resolver`` and only guarantees ordering and queue
-    integrity.
+    integrity. Input queues live in a :class:`TurnWindow` of ``window_size`` turns,
+    so commands may be queued early for upcoming turns without unbounded growth.
     """
 
     def __init__(
         self,
         player_order: Sequence[str],
         action_resolver: Callable[[Command, int], ActionResult],
+        window_size: int = DEFAULT_TURN_WINDOW,
     ) -> None:
         self._player_order: List[str] = list(player_order)
         self._action_resolver = action_resolver
-        self._input_queues: Dict[int, List[QueuedCommand]] = defaultdict(list)
+        self._input_queues: TurnWindow[QueuedCommand] = TurnWindow(window_size)
 
     @property
     def player_order(self) -> List[str]:
         return list(self._player_order)
 
+    @property
+    def window_size(self) -> int:
+        return self._input_queues.size
+
     def queue_input(self, turn_index: int, command: Command) -> None:
-        """Add a player command to the queue for a given turn."""
+        """Add a player command to the queue for a given turn.
+
+        Raises:
+            ValueError: If ``turn_index`` falls outside the queue window.
+        """
 
-        self._input_queues[turn_index].append(QueuedCommand(turn_index, command))
+        self._input_queues.append(turn_index, QueuedCommand(turn_index, command))
 
     def resolve_turn(self, turn_index: int) -> List[ActionResult]:
         """Resolve queued commands for the target turn in player order."""
 
-        queued = self._input_queues.pop(turn_index, [])
+        queued = self._input_queues.pop(turn_index)
         sorted_commands = self._sort_by_player_order(queued)
 
         return [self._action_resolver(entry.command, turn_index) for entry in sorted_commands]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import Generic, List, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_TURN_WINDOW = 8
+
+
+class TurnWindow(Generic[T]):
+    """Fixed-size ring buffer of per-turn buckets.
+
+    Only turns in ``[base_turn, base_turn + size)`` are accepted, so memory stays
+    proportional to ``size`` no matter how long the game runs. Draining a turn
+    slides the window forward past it.
+    """
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise ValueError(f"Window size must be positive: {size}")
+        self._size = size
+        self._slots: List[List[T]] = [[] for _ in range(size)]
+        self._base_turn = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        """Entries currently buffered across all turns in the window."""
+
+        return sum(len(slot) for slot in self._slots)
+
+    @property
+    def base_turn(self) -> int:
+        """Oldest turn that still accepts entries."""
+
+        return self._base_turn
+
+    def accepts(self, turn_index: int) -> bool:
+        return self._base_turn <= turn_index < self._base_turn + self._size
+
+    def append(self, turn_index: int, item: T) -> None:
+        """Add an entry for a turn, rejecting turns outside the window."""
+
+        if not self.accepts(turn_index):
+            raise ValueError(
+                f"Turn {turn_index} outside window "
+                f"[{self._base_turn}, {self._base_turn + self._size})"
+            )
+        self._slots[turn_index % self._size].append(item)
+
+    def pop(self, turn_index: int) -> List[T]:
+        """Drain a turn and advance the window so that it starts after it.
+
+        Entries left behind in skipped earlier turns are discarded. Draining a
+        turn that already slid out of the window returns an empty list.
+        """
+
+        if turn_index < self._base_turn:
+            return []
+
+        items: List[T] = []
+        if turn_index < self._base_turn + self._size:
+            slot = self._slots[turn_index % self._size]
+            items = list(slot)
+            slot.clear()
+
+        stale_end = min(turn_index, self._base_turn + self._size)
+        for stale in range(self._base_turn, stale_end):
+            self._slots[stale % self._size].clear()
+
+        self._base_turn = turn_index + 1
+        return items
@@ -0,0 +1,142 @@
+import hashlib
+import random
+import statistics
+import unittest
+
+from dungeon.entities import Character, Role
+from dungeon.fixed_point import (
+    FIXED_ONE,
+    FixedPointCombatResolver,
+    FixedPointEventResolver,
+    FixedPointShopManager,
+    fixed_scale,
+    ratio_scale,
+    to_fixed,
+    to_ratio,
+)
+from dungeon.resolvers import CombatResolver, EventResolver
+from dungeon.shop import ShopManager
+from src.simulation import SimulationConfig, run_simulation
+
+THRESHOLD_TOLERANCE = 2 / FIXED_ONE
+RATE_TOLERANCE = 0.02
+SHOP_PRICES = list(range(1, 200_000, 7)) + [10_931, 65_536, 10**9 + 7]
+
+# Recorded outcome of SimulationConfig(seed=11, roles=tuple(Role), rules="fixed").
+FIXED_GAME_STANDINGS = {"p1": 37, "p2": 12, "p3": 16, "p4": 27, "p5": 58, "p6": 20}
+FIXED_GAME_DIGEST = "1cee8b85a22088fbe48e1c23a9202d0744dffd67adcce8035bb030ff6542e004"
+
+
+def _hero(role, luck=30, gold=0):
+    return Character("hero", role, attack=12, defense=5, luck=luck, hp=50, gold=gold)
+
+
+def _history_digest(result):
+    digest = hashlib.sha256()
+    for turn in result.history:
+        for entry in turn:
+            events = entry.events
+            digest.update(
+                f"{entry.turn_index}|{entry.player_id}|{entry.vp_delta}|{events['action']}|"
+                f"{events['outcome']}|{events['gold']}|{events['hp']};".encode()
+            )
+    return digest.hexdigest()
+
+
+class FixedPointArithmeticTests(unittest.TestCase):
+    def test_power_of_two_ratios_are_exact_in_q16(self):
+        for ratio in (0.25, 0.5):
+            for value in range(0, 200_000, 3):
+                self.assertEqual(fixed_scale(value, to_fixed(ratio)), int(value * ratio), (value, ratio))
+
+    def test_decimal_multipliers_become_exact_ratios(self):
+        self.assertEqual(to_ratio(0.9), (9, 10))
+        self.assertEqual(to_ratio(0.8), (4, 5))
+        self.assertEqual(to_ratio(0.5 * 1.1), (11, 20))
+        for ratio in (0.8, 0.9, 0.55, 0.625):
+            for value in SHOP_PRICES:
+                self.assertEqual(ratio_scale(value, to_ratio(ratio)), int(value * ratio), (value, ratio))
+
+    def test_negative_values_truncate_toward_zero(self):
+        self.assertEqual(fixed_scale(-7, to_fixed(0.5)), int(-7 * 0.5))
+        self.assertEqual(ratio_scale(-7, to_ratio(0.9)), int(-7 * 0.9))
+
+
+class FixedPointRulesEquivalenceTests(unittest.TestCase):
+    def test_escape_thresholds_track_float_chance(self):
+        fixed, reference = FixedPointCombatResolver(), CombatResolver()
+        for luck in range(0, 200):
+            for difficulty in range(1, 6):
+                threshold = fixed.escape_chance(luck, difficulty) / FIXED_ONE
+                self.assertAlmostEqual(
+                    threshold, reference.escape_chance(luck, difficulty), delta=THRESHOLD_TOLERANCE
+                )
+
+    def test_luck_thresholds_track_float_chance(self):
+        fixed, reference = FixedPointEventResolver(), EventResolver()
+        for luck in range(-20, 200):
+            self.assertAlmostEqual(
+                fixed._luck_roll(luck) / FIXED_ONE, reference._luck_roll(luck), delta=THRESHOLD_TOLERANCE
+            )
+
+    def test_damage_is_identical(self):
+        fixed, reference = FixedPointCombatResolver(), CombatResolver()
+        for role in Role:
+            for attack in range(1, 60):
+                attacker = Character("a", role, attack=attack, defense=0, luck=0, hp=10)
+                defender = _hero(Role.WARRIOR)
+                self.assertEqual(
+                    fixed.calculate_damage(attacker, defender), reference.calculate_damage(attacker, defender)
+                )
+
+    def test_shop_prices_and_exchange_are_identical(self):
+        fixed, reference = FixedPointShopManager(), ShopManager()
+        for role in Role:
+            for base_price in SHOP_PRICES:
+                hero = _hero(role)
+                self.assertEqual(fixed.adjusted_price(base_price, hero), reference.adjusted_price(base_price, hero))
+                self.assertEqual(
+                    fixed.adjusted_sell_price(base_price, hero), reference.adjusted_sell_price(base_price, hero)
+                )
+            self.assertEqual(
+                fixed.exchange_gold_for_vp(_hero(role, gold=97)).vp_gained,
+                reference.exchange_gold_for_vp(_hero(role, gold=97)).vp_gained,
+            )
+
+    def test_event_outcome_rates_match_within_tolerance(self):
+        trials = 20_000
+        for role in (Role.ROGUE, Role.WARRIOR):
+            for method in ("resolve_trap", "resolve_chest", "resolve_side_quest"):
+                rates = []
+                for resolver in (EventResolver(random.Random(5)), FixedPointEventResolver(random.Random(5))):
+                    outcomes = [getattr(resolver, method)(_hero(role)).outcome for _ in range(trials)]
+                    favourable = sum(outcome in {"avoided", "rare", "success"} for outcome in outcomes)
+                    rates.append(favourable / trials)
+                self.assertAlmostEqual(rates[0], rates[1], delta=RATE_TOLERANCE, msg=(role, method))
+
+
+class FixedPointSimulationTests(unittest.TestCase):
+    def test_fixed_games_match_recorded_outcome_stream(self):
+        result = run_simulation(SimulationConfig(seed=11, roles=tuple(Role), rules="fixed"))
+
+        self.assertEqual(result.standings, FIXED_GAME_STANDINGS)
+        self.assertEqual(_history_digest(result), FIXED_GAME_DIGEST)
+
+        float_result = run_simulation(SimulationConfig(seed=11, roles=tuple(Role), rules="float"))
+        self.assertNotEqual(_history_digest(float_result), FIXED_GAME_DIGEST)
+
+    def test_fixed_rules_balance_matches_float_rules(self):
+        def mean_vp(rules):
+            results = [run_simulation(SimulationConfig(seed=seed, rules=rules)) for seed in range(100)]
+            return statistics.mean(vp for result in results for vp in result.standings.values())
+
+        reference = mean_vp("float")
+        self.assertAlmostEqual(mean_vp("fixed"), reference, delta=reference * 0.1)
+
+    def test_unknown_rules_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            run_simulation(SimulationConfig(rules="double"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from src.game_manager import GameManager
+from src.models import ActionResult, Command
+from src.net_session import NetSession
+from src.turn_window import TurnWindow
+
+
+def _one_vp(command, turn_index):
+    return ActionResult(player_id=command.player_id, turn_index=turn_index, vp_delta=1)
+
+
+class TurnWindowTests(unittest.TestCase):
+    def test_rejects_turns_outside_window(self):
+        window = TurnWindow(size=4)
+        window.append(3, "late")
+        with self.assertRaises(ValueError):
+            window.append(4, "too far")
+
+        window.pop(0)
+        window.append(4, "now fits")
+        with self.assertRaises(ValueError):
+            window.append(0, "already drained")
+
+    def test_pop_reuses_slots_and_discards_skipped_turns(self):
+        window = TurnWindow(size=2)
+        window.append(0, "a")
+        window.append(1, "b")
+        self.assertEqual(window.pop(1), ["b"])
+        self.assertEqual(window.base_turn, 2)
+
+        window.append(2, "c")
+        self.assertEqual(window.pop(2), ["c"])
+        self.assertEqual(window.pop(1), [])
+
+
+class GameManagerTurnLimitTests(unittest.TestCase):
+    def test_default_turn_limit(self):
+        manager = GameManager(["p1"], action_resolver=_one_vp)
+        history = manager.run_full_game({})
+        self.assertEqual(len(history), GameManager.TURN_LIMIT)
+
+    def test_long_game_keeps_queue_window_bounded(self):
+        manager = GameManager(["p1", "p2"], action_resolver=_one_vp, turn_limit=10_000, window_size=4)
+        queued = manager.turn_controller._input_queues
+        incoming = manager.net_session._incoming
+
+        for turn in range(manager.turn_limit):
+            manager.enqueue_commands([Command("p1", "move")])
+            if turn + 3 < manager.turn_limit:
+                # Remote commands arrive three turns early and wait in the net session.
+                manager.receive_remote_commands([Command("p2", "move")], turn_index=turn + 3)
+            self.assertLessEqual(len(queued), 1)
+            self.assertLessEqual(len(incoming), incoming.size)
+            manager.resolve_current_turn()
+
+        self.assertEqual(manager.standings(), {"p1": 10_000, "p2": 10_000 - 3})
+        self.assertEqual((len(queued), len(incoming)), (0, 0))
+        self.assertEqual((len(queued._slots), len(incoming._slots)), (4, 4))
+        with self.assertRaises(RuntimeError):
+            manager.resolve_current_turn()
+
+    def test_window_size_follows_or_must_match_net_session(self):
+        session = NetSession(["p1"], window_size=16)
+        manager = GameManager(["p1"], action_resolver=_one_vp, net_session=session)
+        self.assertEqual(manager.turn_controller.window_size, 16)
+
+        with self.assertRaises(ValueError):
+            GameManager(["p1"], action_resolver=_one_vp, net_session=NetSession(["p1"]), window_size=4)
+
+    def test_future_commands_are_accepted_within_window(self):
+        manager = GameManager(["p1", "p2"], action_resolver=_one_vp, window_size=3)
+        manager.receive_remote_commands([Command("p2", "move")], turn_index=2)
+        with self.assertRaises(ValueError):
+            manager.receive_remote_commands([Command("p2", "move")], turn_index=3)
+
+        manager.resolve_current_turn()
+        manager.resolve_current_turn()
+        results = manager.resolve_current_turn()
+        self.assertEqual([result.player_id for result in results], ["p2"])
+
+    def test_rejects_commands_beyond_turn_limit(self):
+        manager = GameManager(["p1"], action_resolver=_one_vp, turn_limit=2)
+        with self.assertRaises(ValueError):
+            manager.receive_remote_commands([Command("p1", "move")], turn_index=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from src.load_test import LoadTestConfig, percentile, run_load_test
+
+
+class LoadTestHarnessTests(unittest.TestCase):
+    def test_clean_network_completes_every_turn(self):
+        config = LoadTestConfig(games=3, peers=3, turns=20, latency_ms=30, jitter_ms=5, think_ms=0)
+        report = run_load_test(config)
+
+        self.assertEqual(report.turns_completed, 3 * 3 * 20)
+        self.assertEqual(report.stalled_games, [])
+        self.assertEqual(report.desynced_games, [])
+        self.assertEqual(report.retransmits, 0)
+        self.assertGreaterEqual(report.latency_percentiles["p50"], 25)
+        self.assertLessEqual(report.latency_percentiles["max"], 2 * (30 + 5))
+
+    def test_virtual_duration_ends_at_last_resolved_turn(self):
+        config = LoadTestConfig(games=1, peers=2, turns=10, latency_ms=40, jitter_ms=0)
+        report = run_load_test(config)
+
+        # Every turn takes think time plus one one-way delay; idle retransmit timers must not count.
+        self.assertEqual(report.virtual_duration_ms, 10 * (config.think_ms + config.latency_ms))
+        self.assertAlmostEqual(report.virtual_turns_per_second, 2 * 10 * 1000 / 450)
+
+    def test_drops_and_reordering_recover_without_desync(self):
+        config = LoadTestConfig(games=4, peers=4, turns=25, drop_rate=0.2, reorder_rate=0.3, jitter_ms=30)
+        report = run_load_test(config)
+
+        self.assertEqual(report.stalled_games, [])
+        self.assertEqual(report.desynced_games, [])
+        self.assertEqual(report.rejected, 0)
+        self.assertGreater(report.messages_dropped, 0)
+        self.assertGreaterEqual(report.retransmits, report.messages_dropped)
+        self.assertGreaterEqual(report.latency_percentiles["p99"], config.retransmit_ms)
+
+    def test_commands_rejected_by_a_small_window_are_resent(self):
+        config = LoadTestConfig(
+            games=4, peers=4, turns=20, window_size=1, jitter_ms=35, reorder_rate=0.3, think_ms=0, seed=2
+        )
+        report = run_load_test(config)
+
+        self.assertGreater(report.rejected, 0)
+        self.assertEqual(report.stalled_games, [])
+        self.assertEqual(report.desynced_games, [])
+        self.assertEqual(report.turns_completed, 4 * 4 * 20)
+
+    def test_exhausted_retransmits_report_the_match_as_stalled(self):
+        config = LoadTestConfig(games=3, peers=3, turns=20, drop_rate=0.9, max_retransmits=1)
+        report = run_load_test(config)
+
+        self.assertEqual(report.stalled_games, [0, 1, 2])
+        self.assertEqual(report.desynced_games, [])
+        self.assertGreater(report.abandoned, 0)
+        self.assertLess(report.turns_completed, 3 * 3 * 20)
+
+    def test_seeded_runs_are_reproducible(self):
+        config = LoadTestConfig(games=2, turns=10, drop_rate=0.1, reorder_rate=0.1, seed=4)
+        first, second = run_load_test(config), run_load_test(config)
+
+        self.assertEqual(first.latency_percentiles, second.latency_percentiles)
+        self.assertEqual(first.virtual_duration_ms, second.virtual_duration_ms)
+
+    def test_rejects_single_peer_matches(self):
+        with self.assertRaises(ValueError):
+            run_load_test(LoadTestConfig(peers=1))
+
+    def test_nearest_rank_percentile(self):
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(percentile(values, 0.5), 50.0)
+        self.assertEqual(percentile(values, 0.99), 99.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
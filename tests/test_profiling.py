@@ -0,0 +1,73 @@
+import unittest
+
+from dungeon.entities import Role
+from src.profiling import PLAN_ACTION, ProfileConfig, profile_workload
+
+
+class ProfilingHarnessTests(unittest.TestCase):
+    def test_deterministic_profile_attributes_subsystems_and_roles(self):
+        config = ProfileConfig(seed=3, games=4, roles=(Role.WARRIOR, Role.MERCHANT), turn_limit=15)
+        report = profile_workload(config)
+
+        subsystems = report.totals_by("subsystem")
+        self.assertIn("AgentDecisionMaker", subsystems)
+        self.assertIn("EventResolver", subsystems)
+        self.assertEqual(set(report.totals_by("role")), {"warrior", "merchant"})
+
+        plan_calls = sum(stats.calls for (_, action), stats in report.scopes.items() if action == PLAN_ACTION)
+        self.assertEqual(plan_calls, 4 * 15 * 2)
+
+    def test_shared_code_is_split_between_calling_subsystems(self):
+        report = profile_workload(ProfileConfig(seed=1, games=3, turn_limit=15))
+
+        for (role, action), scope in report.scopes.items():
+            if action != "combat":
+                continue
+            # Every combat builds a monster and an ActionResult in Simulation and at
+            # least one DamageResult in CombatResolver; all share one generated
+            # ``__init__`` code location.
+            self.assertEqual(report.stacks[(role, action, "Simulation", "__init__")].calls, 2 * scope.calls)
+            damage_results = report.stacks[(role, action, "CombatResolver", "__init__")]
+            self.assertGreaterEqual(damage_results.calls, scope.calls)
+            self.assertNotIn((role, action, "Character", "__init__"), report.stacks)
+
+        max_callers = {
+            subsystem
+            for (_, _, subsystem, function) in report.stacks
+            if function == "<built-in method builtins.max>"
+        }
+        self.assertLessEqual({"CombatResolver", "Character"}, max_callers)
+
+    def test_fixed_rules_are_reported_under_their_reference_subsystems(self):
+        report = profile_workload(ProfileConfig(seed=2, games=3, turn_limit=15, rules="fixed"))
+
+        # The AI's escape estimate calls FixedPointCombatResolver.escape_chance from Simulation.
+        planned = {
+            subsystem
+            for (_, action, subsystem, function) in report.stacks
+            if action == PLAN_ACTION and function == "escape_chance"
+        }
+        self.assertEqual(planned, {"CombatResolver"})
+
+    def test_folded_output_is_flamegraph_compatible(self):
+        report = profile_workload(ProfileConfig(games=2, turn_limit=10))
+        lines = report.to_folded().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            stack, value = line.rsplit(" ", 1)
+            self.assertEqual(len(stack.split(";")), 4)
+            self.assertGreater(int(value), 0)
+
+    def test_sampling_mode_collects_samples(self):
+        report = profile_workload(ProfileConfig(games=10, mode="sampling", sample_interval=0.0002))
+        self.assertEqual(report.mode, "sampling")
+        self.assertGreater(sum(stats.calls for stats in report.stacks.values()), 0)
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            profile_workload(ProfileConfig(mode="tracing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import statistics
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import ActionResult
+from src.replay_archive import ReplayFile, archive_paths, query, write_game
+from src.simulation import SimulationConfig, run_simulation
+
+
+class ReplayArchiveTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+        self.results = [run_simulation(SimulationConfig(seed=seed, turn_limit=25)) for seed in range(6)]
+        for result in self.results:
+            path = self.directory / f"game-{result.seed}.ddr"
+            write_game(path, result.history, result.roles, {"seed": result.seed})
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_round_trip_preserves_columns(self):
+        replay = ReplayFile(self.directory / "game-0.ddr")
+        history = self.results[0].history
+
+        self.assertEqual(replay.meta, {"seed": 0})
+        self.assertEqual(replay.rows("turns"), sum(len(turn) for turn in history))
+        columns = replay.read_columns("turns", ["player_id", "vp_delta", "action"])
+        flattened = [result for turn in history for result in turn]
+        self.assertEqual(columns["player_id"], [result.player_id for result in flattened])
+        self.assertEqual(columns["vp_delta"], [result.vp_delta for result in flattened])
+        self.assertEqual(columns["action"], [result.events["action"] for result in flattened])
+
+    def test_grouped_aggregates_match_in_memory_results(self):
+        grouped = query(archive_paths(self.directory), table="results", group_by=["role"], metrics=["final_vp"])
+
+        for role in ("warrior", "mage", "hunter", "rogue"):
+            expected = [
+                result.standings[player_id]
+                for result in self.results
+                for player_id, value in result.roles.items()
+                if value == role
+            ]
+            self.assertEqual(grouped[(role,)]["final_vp"].total, sum(expected))
+            self.assertEqual(grouped[(role,)]["final_vp"].maximum, max(expected))
+
+        player_rows = sum(aggregates["final_vp"].count for aggregates in grouped.values())
+        self.assertEqual(player_rows, 6 * 4)
+
+    def test_where_filter_and_parallel_scan_agree(self):
+        paths = archive_paths(self.directory)
+        serial = query(paths, group_by=["role"], metrics=["gold"], where={"turn_index": 20})
+        parallel = query(paths, group_by=["role"], metrics=["gold"], where={"turn_index": 20}, workers=2)
+
+        self.assertEqual(
+            {key: value["gold"].total for key, value in serial.items()},
+            {key: value["gold"].total for key, value in parallel.items()},
+        )
+        expected = statistics.mean(
+            turn_result.events["gold"]
+            for result in self.results
+            for turn_result in result.history[20]
+            if turn_result.events["role"] == "rogue"
+        )
+        self.assertAlmostEqual(serial[("rogue",)]["gold"].mean, expected)
+
+    def test_filter_on_missing_string_value_matches_nothing(self):
+        result = query(archive_paths(self.directory), group_by=[], metrics=["vp_delta"], where={"role": "merchant"})
+        self.assertEqual(result, {})
+
+    def test_unknown_columns_are_rejected(self):
+        with self.assertRaises(ValueError):
+            query([], metrics=["luck"])
+        with self.assertRaises(ValueError):
+            query([], metrics=["role"])
+
+    def test_filter_values_must_match_column_type(self):
+        with self.assertRaises(ValueError):
+            query([], where={"turn_index": "abc"})
+        with self.assertRaises(ValueError):
+            query([], where={"role": 3})
+
+    def test_empty_game_is_queryable(self):
+        path = write_game(self.directory / "empty.ddr", [], roles={"p1": "cleric"})
+
+        self.assertEqual(query([path], where={"role": "cleric"}), {})
+        self.assertEqual(query([path], group_by=["role"], where={"turn_index": 0}), {})
+        results = query([path], table="results", group_by=["role"], metrics=["won"], where={"role": "cleric"})
+        self.assertEqual(results[("cleric",)]["won"].total, 1)
+
+    def test_tied_winners_are_flagged(self):
+        path = write_game(
+            self.directory / "tie.ddr",
+            [
+                [
+                    ActionResult("p1", 0, vp_delta=2),
+                    ActionResult("p2", 0, vp_delta=2),
+                    ActionResult("p3", 0, vp_delta=1),
+                ]
+            ],
+            roles={"p1": "cleric", "p2": "mage", "p3": "rogue"},
+        )
+
+        self.assertEqual(
+            ReplayFile(path).read_columns("results", ["won", "tied"]), {"won": [1, 1, 0], "tied": [1, 1, 0]}
+        )
+        outright = query([path], table="results", group_by=[], metrics=["won"], where={"tied": 0})
+        self.assertEqual(outright[()]["won"].total, 0)
+
+    def test_plain_action_results_default_missing_columns(self):
+        path = write_game(
+            self.directory / "plain.ddr",
+            [[ActionResult("p1", 0, vp_delta=2)], [ActionResult("p1", 1, vp_delta=1)]],
+            roles={"p1": "cleric"},
+        )
+        columns = ReplayFile(path).read_columns("turns", ["role", "gold", "action"])
+        self.assertEqual(columns, {"role": ["cleric", "cleric"], "gold": [0, 0], "action": ["", ""]})
+        self.assertEqual(ReplayFile(path).read_columns("results", ["final_vp", "won"]), {"final_vp": [3], "won": [1]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from dungeon.entities import Role
+from src.import_budget import (
+    IMPORT_BUDGET_GAMES,
+    WARM_POOL_MIN_SPEEDUP,
+    measure_game_time,
+    measure_import_time,
+    measure_startup,
+)
+from src.simulation import SimulationConfig, SimulationRunner, run_simulation
+
+
+class SimulationTests(unittest.TestCase):
+    def test_seeded_games_are_reproducible(self):
+        config = SimulationConfig(seed=7, roles=tuple(Role), turn_limit=12)
+        first = run_simulation(config)
+        second = run_simulation(config)
+
+        self.assertEqual(first.standings, second.standings)
+        self.assertEqual(len(first.history), 12)
+        self.assertEqual(first.roles["p5"], Role.MERCHANT.value)
+
+    def test_warm_pool_matches_inline_runs(self):
+        configs = [SimulationConfig(seed=seed, turn_limit=10) for seed in range(6)]
+        inline = SimulationRunner().run_batch(configs)
+        with SimulationRunner(workers=2) as runner:
+            pooled = runner.run_batch(configs)
+            pooled_again = runner.run_batch(configs[:2])
+
+        self.assertEqual([r.standings for r in pooled], [r.standings for r in inline])
+        self.assertEqual([r.standings for r in pooled_again], [r.standings for r in inline[:2]])
+
+
+class ImportBudgetTests(unittest.TestCase):
+    def test_entry_points_import_within_budget(self):
+        report = measure_import_time()
+
+        self.assertEqual(report.heavy_modules, [])
+        self.assertIn("src.simulation", report.cumulative_us)
+        self.assertLessEqual(report.repo_us, IMPORT_BUDGET_GAMES * measure_game_time())
+
+    def test_warm_pool_amortises_process_startup(self):
+        startup = measure_startup(games=8, workers=2)
+
+        self.assertGreaterEqual(startup.speedup, WARM_POOL_MIN_SPEEDUP)
+
+
+if __name__ == "__main__":
+    unittest.main()